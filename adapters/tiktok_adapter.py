@@ -29,7 +29,7 @@ class TikTokAdapter:
     - Campaign execution on TikTok
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], transport: Optional[httpx.AsyncBaseTransport] = None):
         self.config = config
         self.client_key = config.get('client_key')
         self.client_secret = config.get('client_secret')
@@ -37,6 +37,7 @@ class TikTokAdapter:
         
         self.base_url = "https://open-api.tiktok.com"
         self.client = None
+        self.transport = transport  # Shared connection pool, owned by the caller
         
         if self._has_credentials():
             self._initialize_client()
@@ -60,7 +61,8 @@ class TikTokAdapter:
                     "Authorization": f"Bearer {self.access_token}",
                     "Content-Type": "application/json"
                 },
-                timeout=30.0
+                timeout=30.0,
+                transport=self.transport
             )
             
             logger.info("TikTok API client initialized successfully")
@@ -122,6 +124,10 @@ class TikTokAdapter:
             **data
         }
     
+    async def preflight(self):
+        """Prepare for an imminent call; the access token is static, so nothing to do"""
+        return None
+    
     async def health_check(self) -> Dict[str, Any]:
         """Check TikTok API connection health"""
         try:
@@ -153,5 +159,6 @@ class TikTokAdapter:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.client:
+        # aclose() would also close an injected transport that other clients share
+        if self.client and self.transport is None:
             await self.client.aclose()
\ No newline at end of file
@@ -248,6 +248,10 @@ class TwitterAdapter:
             **data
         }
     
+    async def preflight(self):
+        """Prepare for an imminent call; the bearer-token client needs no warm-up"""
+        return None
+    
     async def health_check(self) -> Dict[str, Any]:
         """Check Twitter API connection health"""
         try:
@@ -429,6 +429,11 @@ class YouTubeAdapter:
             **data
         }
     
+    async def preflight(self):
+        """Refresh an expired OAuth token ahead of an imminent call"""
+        if self.credentials is not None and not self.credentials.valid:
+            await asyncio.to_thread(self.credentials.refresh, Request())
+    
     async def health_check(self) -> Dict[str, Any]:
         """Check YouTube API connection health"""
         try:
@@ -13,6 +13,7 @@ import structlog
 import json
 
 from hub.logger import get_logger
+from hub.response_cache import ResponseCache
 
 
 logger = get_logger("cerebras_helper")
@@ -30,7 +31,8 @@ class CerebrasHelper:
     - Multi-platform content adaptation
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], transport: Optional[httpx.AsyncBaseTransport] = None,
+                 response_cache: Optional[ResponseCache] = None):
         self.config = config
         self.api_key = config.get('api_key')
         self.base_url = config.get('base_url', 'https://api.cerebras.ai')
@@ -38,6 +40,11 @@ class CerebrasHelper:
         self.timeout = config.get('timeout', 30)
         
         self.client = None
+        self.transport = transport  # Shared connection pool, owned by the caller
+        
+        # Low-temperature analysis calls repeat for the same tweets; cache them by request
+        self.response_cache = response_cache or ResponseCache(max_entries=config.get('cache_max_entries', 1024))
+        self.analysis_cache_ttl = config.get('analysis_cache_ttl', 3600)
         
         if self.api_key:
             self._initialize_client()
@@ -53,7 +60,8 @@ class CerebrasHelper:
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json"
                 },
-                timeout=self.timeout
+                timeout=self.timeout,
+                transport=self.transport
             )
             
             logger.info("Cerebras API client initialized successfully", model=self.model)
@@ -137,6 +145,19 @@ class CerebrasHelper:
                 "timestamp": datetime.utcnow().isoformat()
             }
     
+    async def _generate_cached(self, namespace: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """generate_content, served from the response cache for identical analysis requests"""
+        payload = {key: request.get(key) for key in ('messages', 'model', 'temperature', 'max_tokens')}
+        cached = await self.response_cache.get(namespace, payload)
+        if cached is not None:
+            return cached
+        
+        result = await self.generate_content(request)
+        # Stub output isn't worth keeping: it's free, and a real client may appear later
+        if result.get('success') and self.client:
+            await self.response_cache.set(namespace, payload, result, self.analysis_cache_ttl)
+        return result
+    
     def _enhance_prompt(self, prompt: str, content_type: str, platform: str, tone: str) -> str:
         """Enhance prompt with context and instructions"""
         enhancements = {
@@ -233,7 +254,8 @@ class CerebrasHelper:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.client:
+        # aclose() would also close an injected transport that other clients share
+        if self.client and self.transport is None:
             await self.client.aclose()
     
     # Twitter-Specific Analysis Tools
@@ -277,7 +299,7 @@ class CerebrasHelper:
                 'max_tokens': 300
             }
             
-            result = await self.generate_content(request)
+            result = await self._generate_cached('cerebras_tweet_sentiment', request)
             
             if result.get('success'):
                 return {
@@ -338,7 +360,7 @@ class CerebrasHelper:
                 'max_tokens': 500
             }
             
-            result = await self.generate_content(request)
+            result = await self._generate_cached('cerebras_conversation_context', request)
             
             if result.get('success'):
                 return {
@@ -396,7 +418,7 @@ class CerebrasHelper:
                 'max_tokens': 400
             }
             
-            result = await self.generate_content(request)
+            result = await self._generate_cached('cerebras_trending_topics', request)
             
             if result.get('success'):
                 return {
@@ -466,7 +488,7 @@ class CerebrasHelper:
                 'max_tokens': 250
             }
             
-            result = await self.generate_content(request)
+            result = await self._generate_cached('cerebras_engagement_priority', request)
             
             if result.get('success'):
                 return {
@@ -527,7 +549,7 @@ class CerebrasHelper:
                 'max_tokens': 300
             }
             
-            result = await self.generate_content(request)
+            result = await self._generate_cached('cerebras_intent_analysis', request)
             
             if result.get('success'):
                 return {
@@ -584,7 +606,7 @@ class CerebrasHelper:
                 'max_tokens': 500
             }
             
-            result = await self.generate_content(request)
+            result = await self._generate_cached('cerebras_technical_data', request)
             
             if result.get('success'):
                 return {
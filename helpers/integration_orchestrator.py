@@ -552,18 +552,15 @@ class IntegrationOrchestrator:
     async def _analyze_mention_with_cerebras(self, mention_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze Twitter mention with Cerebras"""
         if self.cerebras_helper:
-            # Sentiment analysis
-            sentiment_result = await self.cerebras_helper.analyze_tweet_sentiment(
-                mention_data.get('text', '')
-            )
-            
-            # Priority classification
-            priority_result = await self.cerebras_helper.classify_engagement_priority(mention_data)
-            
-            # Intent analysis
-            intent_result = await self.cerebras_helper.analyze_intent(
-                mention_data.get('text', ''),
-                {'platform': 'twitter', 'user': mention_data.get('user', {})}
+            # Sentiment, priority and intent are independent Cerebras calls, so
+            # issue them together; each falls back to a stub result on error
+            sentiment_result, priority_result, intent_result = await asyncio.gather(
+                self.cerebras_helper.analyze_tweet_sentiment(mention_data.get('text', '')),
+                self.cerebras_helper.classify_engagement_priority(mention_data),
+                self.cerebras_helper.analyze_intent(
+                    mention_data.get('text', ''),
+                    {'platform': 'twitter', 'user': mention_data.get('user', {})}
+                )
             )
             
             return {
@@ -114,12 +114,13 @@ class RedisConversationHelper:
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.redis_url = config.get('redis_url', 'redis://localhost:6379')
+        self.redis_url = config.get('redis_url', config.get('url', 'redis://localhost:6379'))
         self.redis_db = config.get('redis_db', 0)
         self.default_ttl = config.get('default_ttl', 3600 * 24 * 7)  # 7 days
         self.working_memory_ttl = config.get('working_memory_ttl', 3600)  # 1 hour
         
         self.redis_client = None
+        self.connection_pool = None
         self._use_stub = config.get('use_stub', True)
         
         if not self._use_stub:
@@ -132,17 +133,32 @@ class RedisConversationHelper:
         """Initialize Redis connection"""
         try:
             import redis.asyncio as redis
-            self.redis_client = redis.from_url(
+            # One pool per helper (i.e. per worker) so requests reuse open connections
+            connection_config = self.config.get('connection', {})
+            self.connection_pool = redis.ConnectionPool.from_url(
                 self.redis_url,
                 db=self.redis_db,
-                decode_responses=True
+                decode_responses=True,
+                max_connections=connection_config.get('max_connections', 50),
+                health_check_interval=connection_config.get('health_check_interval', 30),
+                socket_timeout=connection_config.get('socket_timeout'),
+                socket_connect_timeout=connection_config.get('socket_connect_timeout'),
+                retry_on_timeout=connection_config.get('retry_on_timeout', False)
             )
-            logger.info("Redis connection initialized")
+            self.redis_client = redis.Redis(connection_pool=self.connection_pool)
+            logger.info(f"Redis connection pool initialized (max_connections={self.connection_pool.max_connections})")
         except ImportError:
             logger.warning("Redis not available, using stub mode")
             self._use_stub = True
             self._stub_storage = {}
     
+    async def close(self):
+        """Close the client and disconnect pooled connections"""
+        if self.redis_client is not None:
+            await self.redis_client.close()
+        if self.connection_pool is not None:
+            await self.connection_pool.disconnect()
+    
     # Thread Management
     
     async def create_thread(self, 
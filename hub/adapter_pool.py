@@ -0,0 +1,147 @@
+"""
+Maya Control Plane Adapter Client Pool
+
+Keeps one live client per platform adapter and hands it out under a
+per-platform concurrency cap. Idle clients are health-probed before reuse,
+and unhealthy ones are rebuilt lazily on the next lease.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+import httpx
+
+from hub.logger import get_logger
+
+
+logger = get_logger("adapter_pool")
+
+
+AdapterFactory = Callable[[], Any]
+
+# Errors that say the client's connection is broken rather than that one request
+# was rejected; only these mark a client for rebuild during a lease
+CONNECTION_ERRORS = (httpx.TransportError, ConnectionError)
+
+
+class AdapterClientPool:
+    """
+    Per-platform adapter clients with TTL health probes
+
+    Features:
+    - lease(name) caps in-flight calls per platform with a semaphore
+    - Clients idle longer than ttl are health-probed before the next lease
+    - Unhealthy clients (failed probe or a connection error during a call)
+      are replaced with a fresh one built off the event loop. The old client
+      is closed once no lease on that platform can still be holding it.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        # name -> current adapter; exposed as MayaOrchestrator.adapters
+        self.clients: Dict[str, Any] = {}
+        self._factories: Dict[str, AdapterFactory] = {}
+        self._sems: Dict[str, asyncio.Semaphore] = {}
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._refresh_locks: Dict[str, asyncio.Lock] = {}
+        self._retired: Dict[str, List[Any]] = {}
+
+    def register(self, name: str, factory: AdapterFactory, max_concurrency: int = 8):
+        """Build the first client for a platform and set its concurrency cap"""
+        self._factories[name] = factory
+        self._sems[name] = asyncio.Semaphore(max_concurrency)
+        self._refresh_locks[name] = asyncio.Lock()
+        self._retired[name] = []
+        self._state[name] = {"healthy": True, "last_used": time.monotonic(), "in_use": 0, "rebuilds": 0}
+        self.clients[name] = factory()
+
+    def mark_unhealthy(self, name: str):
+        """Have the next lease rebuild this platform's client"""
+        if name in self._state:
+            self._state[name]["healthy"] = False
+
+    @asynccontextmanager
+    async def lease(self, name: str) -> AsyncIterator[Any]:
+        """Borrow the platform's client for one call"""
+        async with self._sems[name]:
+            await self._refresh_if_needed(name)
+            state = self._state[name]
+            state["in_use"] += 1
+            try:
+                yield self.clients[name]
+            except CONNECTION_ERRORS:
+                state["healthy"] = False
+                raise
+            finally:
+                state["in_use"] -= 1
+                state["last_used"] = time.monotonic()
+                if not state["in_use"]:
+                    await self._close_retired(name)
+
+    async def _refresh_if_needed(self, name: str):
+        """Probe an idle client and rebuild an unhealthy one"""
+        state = self._state[name]
+        if state["healthy"] and time.monotonic() - state["last_used"] < self.ttl:
+            return
+
+        async with self._refresh_locks[name]:
+            if state["healthy"] and time.monotonic() - state["last_used"] >= self.ttl:
+                state["healthy"] = await self._probe(name)
+                state["last_used"] = time.monotonic()
+
+            if not state["healthy"]:
+                try:
+                    # Factories may do blocking auth and discovery (YouTube), so keep them off the loop
+                    client = await asyncio.to_thread(self._factories[name])
+                except Exception as e:
+                    # Keep serving with the old client rather than failing the call
+                    logger.error("Failed to rebuild adapter client", platform=name, error=str(e))
+                    return
+
+                self._retired[name].append(self.clients[name])
+                self.clients[name] = client
+                state["healthy"] = True
+                state["rebuilds"] += 1
+                logger.info("Adapter client rebuilt", platform=name, rebuilds=state["rebuilds"])
+                if not state["in_use"]:
+                    await self._close_retired(name)
+
+    async def _close_retired(self, name: str):
+        """Close clients replaced by a rebuild; only called with no leases outstanding"""
+        retired, self._retired[name] = self._retired[name], []
+        for client in retired:
+            # Adapters that own connections release them as async context managers
+            closer = getattr(client, "__aexit__", None)
+            if closer is None:
+                continue
+            try:
+                await closer(None, None, None)
+            except Exception as e:
+                logger.warning("Failed to close retired adapter client", platform=name, error=str(e))
+
+    async def _probe(self, name: str) -> bool:
+        """Run the adapter's own health check"""
+        health_check = getattr(self.clients[name], "health_check", None)
+        if health_check is None:
+            return True
+        try:
+            result = await health_check()
+            return bool(result.get("healthy", True)) if isinstance(result, dict) else bool(result)
+        except Exception as e:
+            logger.warning("Adapter health probe failed", platform=name, error=str(e))
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-platform health, in-flight and rebuild counters"""
+        now = time.monotonic()
+        return {
+            name: {
+                "healthy": state["healthy"],
+                "in_use": state["in_use"],
+                "rebuilds": state["rebuilds"],
+                "idle_seconds": round(now - state["last_used"], 1)
+            }
+            for name, state in self._state.items()
+        }
@@ -0,0 +1,127 @@
+"""
+Maya Control Plane Request Batching
+
+Coalesces concurrent small requests into one backend call.
+Callers submit a list of items and get back the matching slice of results.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+from hub.logger import get_logger
+
+
+logger = get_logger("batcher")
+
+
+BatchHandler = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+class AsyncBatcher:
+    """
+    Micro-batcher for async backends
+
+    Submissions arriving within max_wait_ms of each other are merged
+    (up to max_batch items) and passed to the handler in a single call.
+    The handler must return one result per input item, in order.
+    """
+
+    def __init__(self, handler: BatchHandler, max_batch: int = 32,
+                 max_wait_ms: float = 5.0, name: str = "batcher"):
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.name = name
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        """Whether the drain task is accepting submissions"""
+        return self._drain_task is not None and not self._drain_task.done()
+
+    async def start(self):
+        """Start the background drain task"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._drain_task = asyncio.create_task(self._drain())
+        logger.info("Batcher started", name=self.name,
+                    max_batch=self.max_batch, max_wait_ms=self.max_wait * 1000)
+
+    async def stop(self):
+        """Stop draining and fail anything still queued"""
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError(f"{self.name} stopped"))
+
+    async def submit(self, items: List[Any]) -> List[Any]:
+        """Queue items for the next batch and wait for their results"""
+        if not self.running:
+            raise RuntimeError(f"{self.name} is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((items, future))
+        return await future
+
+    async def _drain(self):
+        """Collect submissions into batches and dispatch them"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            size = len(batch[0][0])
+            deadline = loop.time() + self.max_wait
+
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(entry)
+                size += len(entry[0])
+
+            # Dispatch without waiting so the next window starts collecting immediately
+            task = asyncio.create_task(self._run_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _run_batch(self, batch: List[Tuple[List[Any], asyncio.Future]]):
+        """Call the handler once and hand each submitter its slice"""
+        all_items = [item for items, _ in batch for item in items]
+
+        try:
+            results = await self.handler(all_items)
+            if len(results) != len(all_items):
+                raise RuntimeError(
+                    f"{self.name} handler returned {len(results)} results for {len(all_items)} items"
+                )
+        except Exception as e:
+            logger.error("Batch failed", name=self.name, submissions=len(batch), error=str(e))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        offset = 0
+        for items, future in batch:
+            if not future.done():
+                future.set_result(results[offset:offset + len(items)])
+            offset += len(items)
@@ -0,0 +1,200 @@
+"""
+Maya Control Plane Intent Router
+
+Deterministic first-pass intent classification. Requests whose intent is
+obvious from their text or payload shape, and whose classification Maya has
+already confirmed, are routed locally without a Maya round trip.
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from hub.logger import get_logger
+
+
+logger = get_logger("intent_router")
+
+
+# (pattern over the lower-cased intent text, intent_type, confidence); first match wins
+_TEXT_RULES = (
+    (re.compile(r"\b(fine[- ]?tun(e|ing)|train(ing)? (a |the )?model)\b"), "fine_tuning", 0.95),
+    (re.compile(r"\b(embed(ding)?s?|semantic similarity|cluster)\b"), "content_analysis", 0.92),
+    (re.compile(r"\b(campaign|marketing)\b"), "campaign_management", 0.92),
+    (re.compile(r"\b(tweet|post|share)\b"), "social_post", 0.92),
+    (re.compile(r"\b(analy[sz]e|performance|metrics)\b"), "performance_analysis", 0.9),
+)
+
+# Default platform per intent when the request doesn't name one (mirrors Maya's suggestions)
+_DEFAULT_PLATFORMS = {
+    "social_post": "twitter",
+    "campaign_management": "multi_platform",
+    "performance_analysis": "analytics",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class CircuitBreaker:
+    """
+    Fail-open breaker for optional backends
+
+    Opens after failure_threshold consecutive failures and lets a single
+    trial call through once reset_timeout seconds have passed.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being skipped"""
+        if self.opened_at is None:
+            return False
+        return time.monotonic() - self.opened_at < self.reset_timeout
+
+    def record_success(self):
+        """Close the breaker after a successful call"""
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        """Count a failure, opening the breaker at the threshold"""
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+class IntentRouter:
+    """
+    Layer-1 intent router in front of Maya
+
+    Features:
+    - Regex and payload-shape classification with a confidence score
+    - Redis-remembered Maya confirmations, keyed by normalized intent text
+    - Circuit breaker around Redis: when it is open, confident
+      classifications are routed without confirmation instead of failing
+    - Hit/fallback counters for the stats endpoint
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, redis_helper: Any = None):
+        self.config = config or {}
+        self.redis_helper = redis_helper
+        self.min_confidence = self.config.get('min_confidence', 0.9)
+        self.ttl = self.config.get('ttl', 3600)
+        self.redis_timeout = self.config.get('redis_timeout_ms', 50) / 1000.0
+        self.breaker = CircuitBreaker(
+            failure_threshold=self.config.get('breaker_failures', 3),
+            reset_timeout=self.config.get('breaker_reset_seconds', 30)
+        )
+        self.counters = {"local_hits": 0, "unconfirmed_hits": 0, "maya_fallbacks": 0, "redis_errors": 0}
+
+    def classify(self, intent: str, platform: Optional[str], content: Optional[Dict[str, Any]]) -> Tuple[Optional[str], float]:
+        """Classify a request deterministically; (None, 0.0) when nothing matches"""
+        content = content or {}
+
+        # Payload shape is the strongest signal: these keys only make sense for one handler
+        if "fine_tuning_config" in content or content.get("dataset_path"):
+            return "fine_tuning", 0.98
+        if isinstance(content.get("texts"), list) and content["texts"]:
+            return "content_analysis", 0.95
+        if content.get("use_tools") or content.get("tools"):
+            return "ai_generation", 0.95
+
+        text = intent.lower()
+        for pattern, intent_type, confidence in _TEXT_RULES:
+            if pattern.search(text):
+                # An explicit platform plus post body removes any remaining ambiguity
+                if intent_type == "social_post" and platform and content.get("content"):
+                    confidence = 0.97
+                return intent_type, confidence
+
+        return None, 0.0
+
+    async def route(self, intent: str, platform: Optional[str], content: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return a local Maya-style response, or None to fall back to Maya"""
+        intent_type, confidence = self.classify(intent, platform, content)
+        if intent_type is None or confidence <= self.min_confidence or self.redis_helper is None:
+            self.counters["maya_fallbacks"] += 1
+            return None
+
+        if self.breaker.is_open:
+            # Redis is unavailable; trust the deterministic rules alone
+            self.counters["unconfirmed_hits"] += 1
+            return self._synthesize(intent_type, confidence, platform, None)
+
+        ok, confirmed = await self._redis_call(self.redis_helper.get_working_memory(self._key(intent, platform)))
+        if ok:
+            self.breaker.record_success()
+        if not confirmed or confirmed.get("intent_type") != intent_type:
+            self.counters["maya_fallbacks"] += 1
+            return None
+
+        self.counters["local_hits"] += 1
+        return self._synthesize(intent_type, confidence, platform, confirmed)
+
+    async def remember(self, intent: str, platform: Optional[str], content: Optional[Dict[str, Any]],
+                       maya_response: Dict[str, Any]):
+        """Record Maya's answer when it agrees with the local classification"""
+        if self.redis_helper is None or self.breaker.is_open:
+            return
+
+        intent_type, confidence = self.classify(intent, platform, content)
+        if intent_type is None or confidence <= self.min_confidence:
+            return
+        if maya_response.get("intent_type") != intent_type:
+            return
+
+        ok, stored = await self._redis_call(self.redis_helper.set_working_memory(
+            self._key(intent, platform), maya_response, self.ttl
+        ))
+        if ok and stored:
+            self.breaker.record_success()
+        elif ok:
+            # The helper reports write errors as False rather than raising
+            self._record_redis_failure()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Router counters and breaker state"""
+        return {
+            **self.counters,
+            "redis_breaker_open": self.breaker.is_open,
+            "redis_configured": self.redis_helper is not None
+        }
+
+    async def _redis_call(self, awaitable) -> Tuple[bool, Any]:
+        """Await a Redis call under a short timeout; (False, None) on error or timeout"""
+        try:
+            return True, await asyncio.wait_for(awaitable, self.redis_timeout)
+        except Exception as e:
+            self._record_redis_failure()
+            logger.warning("Intent router cache unavailable", error=str(e), breaker_open=self.breaker.is_open)
+            return False, None
+
+    def _record_redis_failure(self):
+        """Count a Redis failure toward opening the breaker"""
+        self.counters["redis_errors"] += 1
+        self.breaker.record_failure()
+
+    def _key(self, intent: str, platform: Optional[str]) -> str:
+        """Cache key from whitespace/case-normalized intent text"""
+        normalized = _WHITESPACE.sub(" ", intent.strip().lower())
+        digest = hashlib.sha256(f"{platform or ''}|{normalized}".encode()).hexdigest()
+        return f"intent_route:{digest}"
+
+    def _synthesize(self, intent_type: str, confidence: float, platform: Optional[str],
+                    confirmed: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the maya_response that _route_request expects"""
+        response = dict(confirmed) if confirmed else {
+            "success": True,
+            "intent_type": intent_type,
+            "suggested_platform": platform or _DEFAULT_PLATFORMS.get(intent_type, "general")
+        }
+        response["confidence"] = confidence
+        response["routed_locally"] = True
+        return response
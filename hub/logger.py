@@ -7,13 +7,20 @@ Supports structured logging with JSON output and multiple log levels.
 
 import logging
 import logging.handlers
+import os
 import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
+import orjson
 import structlog
 from datetime import datetime
 
 
+def _orjson_dumps(obj: Any, **kwargs) -> str:
+    """structlog JSONRenderer serializer backed by orjson"""
+    return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class MayaLogger:
     """
     Centralized logging system for Maya Control Plane
@@ -27,7 +34,9 @@ class MayaLogger:
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
-        self.log_level = self.config.get('level', 'INFO')
+        # MAYA_LOG_LEVEL=WARNING in production drops info events at filter_by_level,
+        # before the rest of the processor chain runs
+        self.log_level = os.getenv('MAYA_LOG_LEVEL', self.config.get('level', 'INFO'))
         self.log_format = self.config.get('format', 'json')
         self.log_file = self.config.get('file', 'logs/maya.log')
         self.max_size = self.config.get('max_size', '10MB')
@@ -55,7 +64,7 @@ class MayaLogger:
         ]
         
         if self.log_format == 'json':
-            processors.append(structlog.processors.JSONRenderer())
+            processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
         else:
             processors.append(structlog.dev.ConsoleRenderer())
         
@@ -6,14 +6,26 @@ Manages the flow of requests between Maya API, social platforms, and AI services
 """
 
 import asyncio
+import importlib.util
+import itertools
+import json
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple, Union
 from datetime import datetime
 import yaml
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+import httpx
+import msgspec
+import orjson
 import structlog
 
 from stubs.maya_stub import call_maya
@@ -22,17 +34,35 @@ from adapters.twitter_adapter import TwitterAdapter
 from adapters.youtube_adapter import YouTubeAdapter
 from adapters.tiktok_adapter import TikTokAdapter
 from src.adapters.youtube_adapter_v2 import YouTubeAdapterV2
-from src.maya_cp.helpers.cerebras_helper import CerebrasHelper, create_cerebras_helper, get_model_recommendations
+from src.maya_cp.helpers.cerebras_helper import (
+    CerebrasHelper,
+    create_cerebras_helper,
+    get_model_recommendations,
+    GenerationConfig,
+    EmbeddingConfig,
+    FineTuningConfig,
+)
 from helpers.webhook_helper import WebhookHelper
+from hub.adapter_pool import AdapterClientPool
+from hub.batcher import AsyncBatcher
+from hub.intent_router import IntentRouter
+from hub.logger import _orjson_dumps
+from hub.response_cache import ResponseCache, SemanticCache
+from hub.scheduler import scheduler as task_scheduler
 
 # Import new audio-first components
 from helpers.config_loader import create_component_configs, validate_audio_system_config
 from helpers.assemblyai_helper import create_assemblyai_helper
-from helpers.redis_helper import create_redis_helper
+from helpers.redis_helper import create_redis_helper, ThreadType, MessageRole
 from helpers.maya_audio_bridge import create_maya_audio_bridge
-from helpers.live_streaming_coordinator import create_live_streaming_coordinator
+from helpers.live_streaming_coordinator import create_live_streaming_coordinator, StreamPlatform
 from helpers.integration_orchestrator import create_integration_orchestrator as create_audio_orchestrator
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 # Configure structured logging
 structlog.configure(
@@ -45,7 +75,7 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -56,7 +86,100 @@ structlog.configure(
 logger = structlog.get_logger()
 
 
-class OrchestrationRequest(BaseModel):
+def _load_yaml_cached(path: Union[str, Path]) -> Any:
+    """
+    Load a YAML file through a JSON sidecar (``<name>.json``).
+    
+    The sidecar is reused while it is at least as new as the YAML file and is
+    rewritten atomically otherwise. Data that does not round-trip through JSON
+    unchanged (dates, non-string keys) is never cached.
+    """
+    path = Path(path)
+    cache_path = path.with_name(path.name + ".json")
+    yaml_mtime = path.stat().st_mtime_ns
+    
+    try:
+        if cache_path.stat().st_mtime_ns >= yaml_mtime:
+            with open(cache_path, 'rb') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    
+    try:
+        encoded = json.dumps(data)
+        if json.loads(encoded) == data:
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(encoded)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("YAML sidecar cache not written", path=str(path), error=str(e))
+    
+    return data
+
+
+@lru_cache(maxsize=128)
+def _model_recommendations_json(task_type: str) -> bytes:
+    """Serialized model recommendations; a pure function of task_type"""
+    return orjson.dumps(get_model_recommendations(task_type))
+
+
+# Request ids: per-process prefix (start time + pid) plus a counter; unique across workers
+_REQ_ID_PREFIX = f"{int(time.time()):x}{os.getpid():x}_"
+_REQ_COUNTER = itertools.count()
+
+# Bump when the social_post optimization prompt or result shape changes
+_SOCIAL_OPTIMIZE_CACHE_VERSION = 2
+
+# Every Cerebras chat call starts with the same system message so the provider can
+# reuse its KV cache for the shared prefix; per-request details follow it
+CANONICAL_SYS_PROMPT = (
+    "You are Maya, an expert social media and content assistant. "
+    "Follow the platform named in the next system message, keep the user's intent, "
+    "and respond with the finished content only."
+)
+CANONICAL_SYS_MESSAGE = {"role": "system", "content": CANONICAL_SYS_PROMPT}
+
+# Per-platform generation settings for social_post optimization
+PLATFORM_TOKEN_CAP = {"twitter": 280}
+DEFAULT_TOKEN_CAP = 1000
+PLATFORM_SYS_PROMPT = {
+    p: {"role": "system", "content": f"platform={p}"}
+    for p in ("twitter", "linkedin", "instagram", "facebook", "youtube", "tiktok")
+}
+
+
+@lru_cache(maxsize=64)
+def _platform_generation_config(platform: str, model: str) -> Any:
+    """Generation config for a platform/model pair; instances are shared, treat as read-only"""
+    return GenerationConfig(
+        model=model,
+        max_tokens=PLATFORM_TOKEN_CAP.get(platform, DEFAULT_TOKEN_CAP),
+        temperature=0.8
+    )
+
+
+@lru_cache(maxsize=256)
+def _config_from_json(config_cls: type, config_json: bytes) -> Any:
+    """Validate a config once per distinct payload; instances are shared, treat as read-only"""
+    data = orjson.loads(config_json)
+    model_validate = getattr(config_cls, "model_validate", None)
+    return model_validate(data) if model_validate else config_cls(**data)
+
+
+def _build_config(config_cls: type, config_data: Dict[str, Any]) -> Any:
+    """Build a helper config object, reusing instances for repeated payloads"""
+    return _config_from_json(config_cls, orjson.dumps(config_data, option=orjson.OPT_SORT_KEYS))
+
+
+class OrchestrationRequest(msgspec.Struct, kw_only=True):
     """Request model for orchestration operations"""
     intent: str
     platform: Optional[str] = None
@@ -66,7 +189,7 @@ class OrchestrationRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
-class OrchestrationResponse(BaseModel):
+class OrchestrationResponse(msgspec.Struct, kw_only=True):
     """Response model for orchestration operations"""
     success: bool
     message: str
@@ -75,6 +198,25 @@ class OrchestrationResponse(BaseModel):
     request_id: str
 
 
+# /orchestrate decodes and encodes in one pass, skipping Pydantic validation
+_orchestration_request_decoder = msgspec.json.Decoder(OrchestrationRequest)
+_orchestration_response_encoder = msgspec.json.Encoder(enc_hook=str)
+
+
+async def _decode_orchestration_request(request: Request) -> OrchestrationRequest:
+    """FastAPI dependency: decode the /orchestrate body straight into the struct"""
+    try:
+        return _orchestration_request_decoder.decode(await request.body())
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+# Value -> member tables for path/query enums (a dict hit instead of Enum.__call__)
+_THREAD_TYPES = {member.value: member for member in ThreadType}
+_MESSAGE_ROLES = {member.value: member for member in MessageRole}
+_STREAM_PLATFORMS = {member.value: member for member in StreamPlatform}
+
+
 class MayaOrchestrator:
     """
     Central orchestrator for Maya control plane operations.
@@ -83,10 +225,95 @@ class MayaOrchestrator:
     based on intent analysis and platform requirements.
     """
     
+    # (path, HTTP verb, handler suffix, add_api_route options); handlers are _route_<suffix>
+    _ROUTES = (
+        ("/health", "GET", "health_check", {}),
+        ("/orchestrate", "POST", "orchestrate_request", {}),
+        ("/cerebras/generate", "POST", "cerebras_generate", {}),
+        ("/cerebras/embeddings", "POST", "cerebras_embeddings", {}),
+        ("/cerebras/fine-tune", "POST", "cerebras_fine_tune", {}),
+        ("/cerebras/fine-tune/{job_id}", "GET", "cerebras_fine_tune_status", {}),
+        ("/cerebras/tools", "POST", "cerebras_tools", {}),
+        ("/cerebras/models/recommend/{task_type}", "GET", "cerebras_model_recommend", {"response_class": ORJSONResponse}),
+        ("/cerebras/metrics", "GET", "cerebras_metrics", {}),
+        # Audio-First System Endpoints
+        ("/audio/transcribe", "POST", "transcribe_audio", {}),
+        ("/audio/realtime/start", "POST", "start_realtime_transcription", {}),
+        ("/maya/connect", "POST", "connect_to_maya", {}),
+        ("/maya/send_message", "POST", "send_message_to_maya", {}),
+        ("/conversation/create", "POST", "create_conversation_thread", {}),
+        ("/conversation/{thread_id}/message", "POST", "add_conversation_message", {}),
+        ("/conversation/{thread_id}/context", "GET", "get_conversation_context", {}),
+        ("/stream/start", "POST", "start_live_stream", {}),
+        ("/stream/{stream_id}/status", "GET", "get_stream_status", {}),
+        ("/stream/{stream_id}/highlights", "POST", "get_stream_highlights", {}),
+        ("/workflow/twitter_mention", "POST", "execute_twitter_mention_workflow", {}),
+        ("/workflow/audio_conversation", "POST", "execute_audio_conversation_workflow", {}),
+        ("/workflow/{workflow_id}/status", "GET", "get_workflow_status", {}),
+        ("/audio/system/health", "GET", "audio_system_health", {}),
+        ("/maya/intent", "POST", "process_maya_intent", {}),
+        ("/campaign/create", "POST", "create_campaign", {}),
+        ("/orchestrator/stats", "GET", "orchestrator_stats", {}),
+    )
+    
     def __init__(self, config_path: str = "config/config.yaml"):
         self.config = self._load_config(config_path)
-        self.adapters = {}
+        # Platform adapters live in the pool; self.adapters is its name -> current client view
+        self._adapter_pool = AdapterClientPool(
+            ttl=self.config.get('http', {}).get('adapter_client_ttl', 300)
+        )
+        self.adapters = self._adapter_pool.clients
         self.helpers = {}
+        self._http_transport: Optional[httpx.AsyncHTTPTransport] = None
+        self._embed_sem: Optional[asyncio.Semaphore] = None
+        self._embed_batcher: Optional[AsyncBatcher] = None
+        self._intent_batcher: Optional[AsyncBatcher] = None
+        # Future-dated tasks and retries only run while the scheduler's ticker does
+        self._scheduler = task_scheduler
+        
+        # Coarse wall clock for /health, refreshed once a second by _tick_clock
+        self._now = datetime.utcnow()
+        self._clock_task: Optional[asyncio.Task] = None
+        
+        # High-priority request log entries, written in batches by _log_drain
+        self._logq: asyncio.Queue = asyncio.Queue()
+        self._log_task: Optional[asyncio.Task] = None
+        self._response_cache = ResponseCache(
+            max_entries=self.config.get('cache', {}).get('max_entries', 1024)
+        )
+        self._semantic_cache: Optional[SemanticCache] = None
+        self._intent_router = IntentRouter(self.config.get('app', {}).get('intent_router', {}))
+        
+        # Admission control for process_request: at most max_concurrent_requests run at
+        # once, and callers are turned away with 503 once max_queued_requests are waiting.
+        # Size by downstream (Maya/Cerebras) capacity, not by core count.
+        app_config = self.config.get('app', {})
+        self._gate = asyncio.Semaphore(app_config.get('max_concurrent_requests', 64))
+        self._max_queue_depth = app_config.get('max_queued_requests', 256)
+        self._queue_depth = 0
+        self._in_flight = 0
+        self._rejected = 0
+        
+        # (content keys, prompt length bucket) -> model chosen for ai_generation
+        self._model_choices: Dict[Tuple[frozenset, int], str] = {}
+        
+        # intent_type -> handler for _route_request; unknown intents use _handle_default.
+        # Intents whose feature is switched off in app.features are left out of the
+        # table entirely, so routing never checks flags per request.
+        features = self.config.get('app', {}).get('features', {})
+        self._handlers = {
+            "social_post": self._handle_social_post,
+            "ai_generation": self._handle_ai_generation,
+            "campaign_management": self._handle_campaign_operation,
+        }
+        if features.get('embeddings', True):
+            self._handlers["content_analysis"] = self._handle_content_analysis
+        if features.get('fine_tuning', True):
+            self._handlers["fine_tuning"] = self._handle_fine_tuning
+        
+        # config/cerebras.yaml is merged into the helper on first Cerebras use
+        self._cerebras_yaml_loaded = False
+        self._cerebras_yaml_lock = asyncio.Lock()
         
         # Audio-first system components
         self.audio_components = {}
@@ -95,31 +322,163 @@ class MayaOrchestrator:
         self.app = FastAPI(
             title="Maya Control Plane",
             description="AI-powered social media orchestration system with audio-first interactions",
-            version="0.2.0"
+            version="0.2.0",
+            default_response_class=ORJSONResponse,
+            lifespan=self._lifespan
         )
         
-        # Initialize components asynchronously
+        # Components are initialized once at startup by the lifespan handler
         self._components_initialized = False
         self._audio_system_initialized = False
+        self._init_lock = asyncio.Lock()
         self._setup_routes()
         
+        # Hot-path logging: bind once, and skip building events INFO would drop
+        self._req_log = logger.bind(component="orchestrator")
+        self._info_enabled = self._req_log.isEnabledFor(logging.INFO)
+        
         logger.info("Maya Orchestrator initialized", config_loaded=bool(self.config))
     
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """Initialize components at startup and release them at shutdown"""
+        if sys.version_info >= (3, 12):
+            # Coroutines that finish without suspending skip Task scheduling
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        
+        await self.initialize()
+        
+        # Coalesce concurrent /cerebras/embeddings calls into shared backend requests
+        cerebras_config = self.config.get('ai_services', {}).get('cerebras', {})
+        self._embed_batcher = AsyncBatcher(
+            self._embed_texts,
+            max_batch=cerebras_config.get('embed_coalesce_max_batch', 32),
+            max_wait_ms=cerebras_config.get('embed_coalesce_wait_ms', 5),
+            name="embeddings"
+        )
+        await self._embed_batcher.start()
+        
+        # Near-duplicate prompt cache; its embeddings ride the embeddings batcher
+        semantic_config = self.config.get('cache', {}).get('semantic', {})
+        if semantic_config.get('enabled', True):
+            self._semantic_cache = SemanticCache(
+                self._response_cache,
+                self._embed_batcher.submit,
+                threshold=semantic_config.get('threshold', 0.93),
+                max_entries=semantic_config.get('max_entries', 512)
+            )
+        
+        # Coalesce per-request Maya intent analysis into analyze_intent_batch calls
+        app_config = self.config.get('app', {})
+        self._intent_batcher = AsyncBatcher(
+            self._analyze_intents,
+            max_batch=app_config.get('intent_batch_size', 16),
+            max_wait_ms=app_config.get('intent_batch_wait_ms', 5),
+            name="maya_intents"
+        )
+        await self._intent_batcher.start()
+        
+        self._clock_task = asyncio.create_task(self._tick_clock())
+        self._log_task = asyncio.create_task(self._log_drain())
+        await self._scheduler.start()
+        try:
+            yield
+        finally:
+            await self.shutdown()
+    
     async def initialize(self):
         """Initialize components asynchronously"""
-        if not self._components_initialized:
-            await self._initialize_components()
-            self._components_initialized = True
+        async with self._init_lock:
+            # Logging may have been (re)configured since construction
+            self._info_enabled = self._req_log.isEnabledFor(logging.INFO)
+            
+            if not self._components_initialized:
+                await self._initialize_components()
+                self._components_initialized = True
+            
+            if not self._audio_system_initialized:
+                await self._initialize_audio_system()
+                self._audio_system_initialized = True
+                # Share cached responses across workers once Redis is up
+                self._response_cache.redis_helper = self.audio_components.get('redis')
+                self._intent_router.redis_helper = self.audio_components.get('redis')
+    
+    async def shutdown(self):
+        """Stop background tasks and release pooled connections"""
+        await self._scheduler.stop()
         
-        if not self._audio_system_initialized:
-            await self._initialize_audio_system()
-            self._audio_system_initialized = True
+        if self._clock_task is not None:
+            self._clock_task.cancel()
+            self._clock_task = None
+        
+        if self._log_task is not None:
+            self._log_task.cancel()
+            self._log_task = None
+        self._flush_log_queue()
+        
+        self._semantic_cache = None
+        if self._embed_batcher is not None:
+            await self._embed_batcher.stop()
+            self._embed_batcher = None
+        
+        if self._intent_batcher is not None:
+            await self._intent_batcher.stop()
+            self._intent_batcher = None
+        
+        if self.audio_components.get('redis') is not None:
+            await self.audio_components['redis'].close()
+        
+        if self._http_transport is not None:
+            await self._http_transport.aclose()
+            self._http_transport = None
+    
+    async def _log_drain(self, max_batch: int = 256, max_wait: float = 0.1):
+        """Write queued high-priority request logs, up to max_batch entries or max_wait seconds per batch"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._logq.get()]
+            deadline = loop.time() + max_wait
+            while len(batch) < max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._logq.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._write_log_batch(batch)
+    
+    def _flush_log_queue(self):
+        """Write whatever is still queued; used at shutdown"""
+        batch = []
+        while not self._logq.empty():
+            batch.append(self._logq.get_nowait())
+        if batch:
+            self._write_log_batch(batch)
+    
+    def _write_log_batch(self, batch: List[Tuple[OrchestrationRequest, Dict[str, Any]]]):
+        """One structured log line for a batch of high-priority requests"""
+        logger.info("High priority requests processed",
+                    count=len(batch),
+                    requests=[
+                        {
+                            "intent": request.intent,
+                            "result_status": result.get("status") if isinstance(result, dict) else None,
+                            "priority": request.priority
+                        }
+                        for request, result in batch
+                    ])
+    
+    async def _tick_clock(self):
+        """Refresh the cached timestamp so /health doesn't build one per request"""
+        while True:
+            self._now = datetime.utcnow()
+            await asyncio.sleep(1)
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file"""
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return _load_yaml_cached(config_path)
         except FileNotFoundError:
             logger.warning("Config file not found, using defaults", path=config_path)
             return {}
@@ -130,27 +489,42 @@ class MayaOrchestrator:
     async def _initialize_components(self):
         """Initialize adapters and helpers"""
         try:
-            # Initialize platform adapters
-            self.adapters['twitter'] = TwitterAdapter(self.config.get('platforms', {}).get('twitter', {}))
-            self.adapters['youtube'] = YouTubeAdapterV2(self.config.get('platforms', {}).get('youtube', {}))
-            self.adapters['tiktok'] = TikTokAdapter(self.config.get('platforms', {}).get('tiktok', {}))
+            # One keep-alive pool shared by every httpx-based client (adapters + Cerebras)
+            http_config = self.config.get('http', {})
+            # HTTP/2 multiplexes concurrent calls to one host over a single connection
+            http2 = http_config.get('http2', True) and importlib.util.find_spec("h2") is not None
+            self._http_transport = httpx.AsyncHTTPTransport(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=http_config.get('max_connections', 200),
+                    max_keepalive_connections=http_config.get('max_keepalive_connections', 50),
+                    keepalive_expiry=http_config.get('keepalive_expiry', 60)
+                )
+            )
+            
+            # Initialize platform adapters; the pool rebuilds them from these factories
+            # when a health probe fails. max_concurrency caps in-flight calls per
+            # adapter so bursts stay within platform rate limits.
+            platforms_config = self.config.get('platforms', {})
+            factories = {
+                'twitter': lambda: TwitterAdapter(platforms_config.get('twitter', {})),
+                'youtube': lambda: YouTubeAdapterV2(platforms_config.get('youtube', {})),
+                'tiktok': lambda: TikTokAdapter(platforms_config.get('tiktok', {}), transport=self._http_transport),
+            }
+            for name, factory in factories.items():
+                self._adapter_pool.register(
+                    name, factory, max_concurrency=platforms_config.get(name, {}).get('max_concurrency', 8)
+                )
             
             # Initialize helpers with advanced Cerebras integration
             cerebras_config = self.config.get('ai_services', {}).get('cerebras', {})
-            self.helpers['cerebras'] = await create_cerebras_helper(cerebras_config)
+            self._embed_sem = asyncio.Semaphore(cerebras_config.get('embed_concurrency', 4))
+            self.helpers['cerebras'] = await create_cerebras_helper(cerebras_config, transport=self._http_transport)
             self.helpers['webhook'] = WebhookHelper(self.config.get('webhooks', {}))
             
-            # Load Cerebras configuration from dedicated config file
-            cerebras_yaml_path = Path("config/cerebras.yaml")
-            if cerebras_yaml_path.exists():
-                with open(cerebras_yaml_path, 'r') as f:
-                    cerebras_full_config = yaml.safe_load(f)
-                    # Update helper with full configuration
-                    self.helpers['cerebras'].config.update(cerebras_full_config)
-                    logger.info("Loaded Cerebras configuration", config_file=str(cerebras_yaml_path))
-            
             logger.info("Components initialized successfully", 
                        adapters=len(self.adapters), 
+                       http2=http2,
                        helpers=len(self.helpers),
                        cerebras_tools=len(self.helpers['cerebras'].registered_tools))
             
@@ -158,6 +532,25 @@ class MayaOrchestrator:
             logger.error("Failed to initialize components", error=str(e))
             raise
     
+    async def _ensure_cerebras_config(self):
+        """Merge the dedicated Cerebras config file into the helper exactly once"""
+        if self._cerebras_yaml_loaded:
+            return
+        
+        async with self._cerebras_yaml_lock:
+            if self._cerebras_yaml_loaded:
+                return
+            
+            cerebras_yaml_path = Path("config/cerebras.yaml")
+            # Runs on the event loop, so keep the stat/parse off it
+            if await asyncio.to_thread(cerebras_yaml_path.exists):
+                cerebras_full_config = await asyncio.to_thread(_load_yaml_cached, cerebras_yaml_path)
+                # Update helper with full configuration
+                self.helpers['cerebras'].config.update(cerebras_full_config)
+                logger.info("Loaded Cerebras configuration", config_file=str(cerebras_yaml_path))
+            
+            self._cerebras_yaml_loaded = True
+    
     async def _initialize_audio_system(self):
         """Initialize audio-first system components"""
         try:
@@ -224,475 +617,540 @@ class MayaOrchestrator:
         except ImportError:
             logger.info("Twitter routes not found, skipping")
         
-        @self.app.get("/health")
-        async def health_check():
-            """Health check endpoint"""
-            await self.initialize()  # Ensure components are initialized
+        # Handlers are methods, so registering them doesn't build closures per instance
+        for path, verb, name, options in self._ROUTES:
+            self.app.add_api_route(path, getattr(self, f"_route_{name}"), methods=[verb], name=name, **options)
+    
+    # Route handlers (registered from _ROUTES)
+    
+    async def _route_health_check(self):
+        """Health check endpoint"""
+        # Check Cerebras health
+        cerebras_health = await self.helpers['cerebras'].health_check()
+        
+        return {
+            "status": "healthy", 
+            "timestamp": self._now,
+            "components": {
+                "cerebras": cerebras_health,
+                "adapters": list(self.adapters.keys()),
+                "helpers": list(self.helpers.keys())
+            }
+        }
+    
+    async def _route_orchestrate_request(self, request: OrchestrationRequest = Depends(_decode_orchestration_request)):
+        """Main orchestration endpoint"""
+        response = await self.process_request(request)
+        return Response(content=_orchestration_response_encoder.encode(response), media_type="application/json")
+    
+    async def _route_cerebras_generate(self, request: Dict[str, Any]):
+        """Advanced Cerebras text generation endpoint"""
+        await self._ensure_cerebras_config()
+        try:
+            messages = request.get("messages", [])
+            config_data = request.get("config", {})
+            stream = request.get("stream", False)
             
-            # Check Cerebras health
-            cerebras_health = await self.helpers['cerebras'].health_check()
+            # Create generation config
+            config = _build_config(GenerationConfig, config_data) if config_data else None
             
-            return {
-                "status": "healthy", 
-                "timestamp": datetime.utcnow(),
-                "components": {
-                    "cerebras": cerebras_health,
-                    "adapters": list(self.adapters.keys()),
-                    "helpers": list(self.helpers.keys())
+            if stream:
+                # Forward chunks as they are produced instead of buffering the completion
+                chunks = self.helpers['cerebras'].generate_text(messages, config, stream=True)
+                return StreamingResponse(
+                    self._sse_stream(chunks),
+                    media_type="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+                )
+            
+            cache_payload = {"messages": messages, "config": config_data}
+            cached = await self._response_cache.get("cerebras_generate", cache_payload)
+            if cached is not None:
+                return cached
+            
+            result = await self.helpers['cerebras'].generate_text(messages, config)
+            await self._cache_result("cerebras_generate", cache_payload, result)
+            return result
+            
+        except Exception as e:
+            logger.error("Cerebras generation failed", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_cerebras_embeddings(self, request: Dict[str, Any]):
+        """Cerebras embeddings generation endpoint"""
+        await self._ensure_cerebras_config()
+        try:
+            texts = request.get("texts", [])
+            config_data = request.get("config", {})
+            
+            # Create embedding config
+            config = _build_config(EmbeddingConfig, config_data) if config_data else None
+            
+            cache_payload = {"texts": texts, "config": config_data}
+            cached = await self._response_cache.get("cerebras_embeddings", cache_payload)
+            if cached is not None:
+                return cached
+            
+            # Default-config requests share batches; custom configs go straight through
+            if config is None and texts and self._embed_batcher is not None and self._embed_batcher.running:
+                embeddings = await self._embed_batcher.submit(texts)
+                result = {
+                    "success": True,
+                    "embeddings": embeddings,
+                    "count": len(embeddings),
+                    "dimensions": len(embeddings[0]) if embeddings else 0
                 }
+            else:
+                result = await self._generate_embeddings_batched(texts, config)
+            
+            await self._cache_result("cerebras_embeddings", cache_payload, result)
+            return result
+            
+        except Exception as e:
+            logger.error("Cerebras embeddings failed", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_cerebras_fine_tune(self, request: Dict[str, Any]):
+        """Start Cerebras fine-tuning job"""
+        await self._ensure_cerebras_config()
+        try:
+            config_data = request.get("config", {})
+            dataset_path = request.get("dataset_path")
+            
+            # Create fine-tuning config
+            config = _build_config(FineTuningConfig, config_data)
+            
+            result = await self.helpers['cerebras'].start_fine_tuning(config, dataset_path)
+            return result
+            
+        except Exception as e:
+            logger.error("Cerebras fine-tuning failed", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_cerebras_fine_tune_status(self, job_id: str):
+        """Get Cerebras fine-tuning job status"""
+        await self._ensure_cerebras_config()
+        try:
+            result = await self.helpers['cerebras'].get_fine_tuning_status(job_id)
+            return result
+            
+        except Exception as e:
+            logger.error("Failed to get fine-tuning status", job_id=job_id, error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_cerebras_tools(self, request: Dict[str, Any]):
+        """Cerebras generation with tool calling"""
+        await self._ensure_cerebras_config()
+        try:
+            messages = request.get("messages", [])
+            tools = request.get("tools")
+            config_data = request.get("config", {})
+            
+            config = _build_config(GenerationConfig, config_data) if config_data else None
+            
+            result = await self.helpers['cerebras'].call_with_tools(messages, tools, config)
+            return result
+            
+        except Exception as e:
+            logger.error("Cerebras tool calling failed", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    # Kept async: the body is a cached lookup, so a threadpool hop (what a
+    # plain def would get) costs more than running it inline on the loop
+    async def _route_cerebras_model_recommend(self, task_type: str):
+        """Get Cerebras model recommendations for task type"""
+        try:
+            return Response(content=_model_recommendations_json(task_type), media_type="application/json")
+            
+        except Exception as e:
+            logger.error("Model recommendation failed", task_type=task_type, error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_cerebras_metrics(self, window_minutes: int = 60):
+        """Get Cerebras performance metrics"""
+        await self._ensure_cerebras_config()
+        try:
+            metrics = self.helpers['cerebras'].get_performance_metrics(window_minutes)
+            if isinstance(metrics, dict):
+                metrics = {**metrics, "response_cache": self._response_cache.stats}
+            return metrics
+            
+        except Exception as e:
+            logger.error("Failed to get metrics", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    # Audio-First System Endpoints
+    
+    async def _route_transcribe_audio(self, file_path: str, options: Dict[str, Any] = None):
+        """Transcribe audio file with AssemblyAI"""
+        try:
+            if not self.audio_components.get('assemblyai'):
+                raise HTTPException(status_code=503, detail="AssemblyAI not available")
+            
+            result = await self.audio_components['assemblyai'].transcribe_audio_file(
+                file_path, options or {}
+            )
+            return result
+            
+        except Exception as e:
+            logger.error("Audio transcription failed", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_start_realtime_transcription(self):
+        """Start real-time audio transcription"""
+        try:
+            if not self.audio_components.get('assemblyai'):
+                raise HTTPException(status_code=503, detail="AssemblyAI not available")
+            
+            def on_transcript(data):
+                logger.info("Real-time transcript", text=data.get('text', '')[:50])
+            
+            started = await self.audio_components['assemblyai'].start_realtime_transcription(on_transcript)
+            return {"started": started, "status": "real-time transcription active"}
+            
+        except Exception as e:
+            logger.error("Failed to start real-time transcription", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_connect_to_maya(self, credentials: Dict[str, Any] = None):
+        """Connect to Maya via audio bridge"""
+        try:
+            if not self.audio_components.get('maya_bridge'):
+                raise HTTPException(status_code=503, detail="Maya Audio Bridge not available")
+            
+            connected = await self.audio_components['maya_bridge'].connect_to_maya(credentials)
+            
+            if connected:
+                state = await self.audio_components['maya_bridge'].get_maya_interface_state()
+                return {"connected": True, "session_id": state.get('session_id'), "state": state}
+            else:
+                return {"connected": False, "error": "Failed to connect to Maya"}
+            
+        except Exception as e:
+            logger.error("Maya connection failed", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_send_message_to_maya(self, message: str, use_tts: bool = True, wait_for_response: bool = True):
+        """Send message to Maya with optional TTS"""
+        try:
+            if not self.audio_components.get('maya_bridge'):
+                raise HTTPException(status_code=503, detail="Maya Audio Bridge not available")
+            
+            response = await self.audio_components['maya_bridge'].send_message_to_maya(
+                message, use_tts, wait_for_response
+            )
+            return response
+            
+        except Exception as e:
+            logger.error("Failed to send message to Maya", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_create_conversation_thread(self, thread_type: str, title: str, platform_data: Dict[str, Any]):
+        """Create conversation thread in Redis"""
+        try:
+            if not self.audio_components.get('redis'):
+                raise HTTPException(status_code=503, detail="Redis not available")
+            
+            thread_type_enum = _THREAD_TYPES.get(thread_type)
+            if thread_type_enum is None:
+                raise HTTPException(status_code=400, detail=f"Invalid thread_type: {thread_type}")
+            
+            thread = await self.audio_components['redis'].create_thread(
+                thread_type_enum, title, platform_data
+            )
+            
+            return {
+                "thread_id": thread.id,
+                "type": thread.type.value,
+                "title": thread.title,
+                "created_at": thread.created_at
             }
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Failed to create conversation thread", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_add_conversation_message(self, thread_id: str, role: str, content: str, platform: str, metadata: Dict[str, Any] = None):
+        """Add message to conversation thread"""
+        try:
+            if not self.audio_components.get('redis'):
+                raise HTTPException(status_code=503, detail="Redis not available")
+            
+            role_enum = _MESSAGE_ROLES.get(role)
+            if role_enum is None:
+                raise HTTPException(status_code=400, detail=f"Invalid role: {role}")
+            
+            message = await self.audio_components['redis'].add_message(
+                thread_id, role_enum, content, platform, metadata or {}
+            )
+            
+            if message:
+                return {
+                    "message_id": message.id,
+                    "thread_id": message.thread_id,
+                    "role": message.role.value,
+                    "timestamp": message.timestamp
+                }
+            else:
+                raise HTTPException(status_code=404, detail="Thread not found")
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Failed to add conversation message", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_get_conversation_context(self, thread_id: str, max_messages: int = 10):
+        """Get conversation context"""
+        try:
+            if not self.audio_components.get('redis'):
+                raise HTTPException(status_code=503, detail="Redis not available")
+            
+            context = await self.audio_components['redis'].get_conversation_context(
+                thread_id, max_messages
+            )
+            return context
+            
+        except Exception as e:
+            logger.error("Failed to get conversation context", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_start_live_stream(self, platform: str, config: Dict[str, Any]):
+        """Start live stream"""
+        try:
+            if not self.audio_components.get('live_streaming'):
+                raise HTTPException(status_code=503, detail="Live Streaming not available")
+            
+            platform_enum = _STREAM_PLATFORMS.get(platform)
+            if platform_enum is None:
+                raise HTTPException(status_code=400, detail=f"Invalid platform: {platform}")
+            
+            result = await self.audio_components['live_streaming'].start_stream(
+                platform_enum, config
+            )
+            return result
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("Failed to start live stream", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_get_stream_status(self, stream_id: str):
+        """Get live stream status"""
+        try:
+            if not self.audio_components.get('live_streaming'):
+                raise HTTPException(status_code=503, detail="Live Streaming not available")
+            
+            status = await self.audio_components['live_streaming'].get_stream_status(stream_id)
+            return status
+            
+        except Exception as e:
+            logger.error("Failed to get stream status", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_get_stream_highlights(self, stream_id: str, time_window: int = 300):
+        """Get key moments from live stream"""
+        try:
+            if not self.audio_components.get('live_streaming'):
+                raise HTTPException(status_code=503, detail="Live Streaming not available")
+            
+            highlights = await self.audio_components['live_streaming'].identify_key_moments(
+                stream_id, time_window
+            )
+            return {"highlights": highlights, "count": len(highlights)}
+            
+        except Exception as e:
+            logger.error("Failed to get stream highlights", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_execute_twitter_mention_workflow(self, mention_data: Dict[str, Any], config: Dict[str, Any] = None):
+        """Execute Twitter mention response workflow"""
+        try:
+            if not self.audio_orchestrator:
+                raise HTTPException(status_code=503, detail="Audio Orchestrator not available")
+            
+            result = await self.audio_orchestrator.execute_twitter_mention_workflow(
+                mention_data, config or {}
+            )
+            return result
+            
+        except Exception as e:
+            logger.error("Twitter mention workflow failed", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_execute_audio_conversation_workflow(self, audio_data: bytes, context: Dict[str, Any] = None):
+        """Execute audio conversation workflow"""
+        try:
+            if not self.audio_orchestrator:
+                raise HTTPException(status_code=503, detail="Audio Orchestrator not available")
+            
+            result = await self.audio_orchestrator.execute_audio_conversation_workflow(
+                audio_data, context or {}
+            )
+            return result
+            
+        except Exception as e:
+            logger.error("Audio conversation workflow failed", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_get_workflow_status(self, workflow_id: str):
+        """Get workflow status"""
+        try:
+            if not self.audio_orchestrator:
+                raise HTTPException(status_code=503, detail="Audio Orchestrator not available")
+            
+            status = await self.audio_orchestrator.get_workflow_status(workflow_id)
+            return status
+            
+        except Exception as e:
+            logger.error("Failed to get workflow status", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_audio_system_health(self):
+        """Check audio system health"""
         
-        @self.app.post("/orchestrate", response_model=OrchestrationResponse)
-        async def orchestrate_request(request: OrchestrationRequest, background_tasks: BackgroundTasks):
-            """Main orchestration endpoint"""
-            await self.initialize()  # Ensure components are initialized
-            return await self.process_request(request, background_tasks)
+        health_status = {
+            "audio_system_initialized": self._audio_system_initialized,
+            "components": {},
+            "orchestrator": bool(self.audio_orchestrator)
+        }
         
-        @self.app.post("/cerebras/generate")
-        async def cerebras_generate(request: Dict[str, Any]):
-            """Advanced Cerebras text generation endpoint"""
-            await self.initialize()
-            try:
-                from src.maya_cp.helpers.cerebras_helper import GenerationConfig
-                
-                messages = request.get("messages", [])
-                config_data = request.get("config", {})
-                stream = request.get("stream", False)
-                
-                # Create generation config
-                config = GenerationConfig(**config_data) if config_data else None
-                
-                result = await self.helpers['cerebras'].generate_text(messages, config, stream)
-                return result
-                
-            except Exception as e:
-                logger.error("Cerebras generation failed", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/cerebras/embeddings")
-        async def cerebras_embeddings(request: Dict[str, Any]):
-            """Cerebras embeddings generation endpoint"""
-            await self.initialize()
-            try:
-                from src.maya_cp.helpers.cerebras_helper import EmbeddingConfig
-                
-                texts = request.get("texts", [])
-                config_data = request.get("config", {})
-                
-                # Create embedding config
-                config = EmbeddingConfig(**config_data) if config_data else None
-                
-                result = await self.helpers['cerebras'].generate_embeddings(texts, config)
-                return result
-                
-            except Exception as e:
-                logger.error("Cerebras embeddings failed", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/cerebras/fine-tune")
-        async def cerebras_fine_tune(request: Dict[str, Any]):
-            """Start Cerebras fine-tuning job"""
-            await self.initialize()
-            try:
-                from src.maya_cp.helpers.cerebras_helper import FineTuningConfig
-                
-                config_data = request.get("config", {})
-                dataset_path = request.get("dataset_path")
-                
-                # Create fine-tuning config
-                config = FineTuningConfig(**config_data)
-                
-                result = await self.helpers['cerebras'].start_fine_tuning(config, dataset_path)
-                return result
-                
-            except Exception as e:
-                logger.error("Cerebras fine-tuning failed", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.get("/cerebras/fine-tune/{job_id}")
-        async def cerebras_fine_tune_status(job_id: str):
-            """Get Cerebras fine-tuning job status"""
-            await self.initialize()
-            try:
-                result = await self.helpers['cerebras'].get_fine_tuning_status(job_id)
-                return result
-                
-            except Exception as e:
-                logger.error("Failed to get fine-tuning status", job_id=job_id, error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/cerebras/tools")
-        async def cerebras_tools(request: Dict[str, Any]):
-            """Cerebras generation with tool calling"""
-            await self.initialize()
-            try:
-                messages = request.get("messages", [])
-                tools = request.get("tools")
-                config_data = request.get("config", {})
-                
-                from src.maya_cp.helpers.cerebras_helper import GenerationConfig
-                config = GenerationConfig(**config_data) if config_data else None
-                
-                result = await self.helpers['cerebras'].call_with_tools(messages, tools, config)
-                return result
-                
-            except Exception as e:
-                logger.error("Cerebras tool calling failed", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.get("/cerebras/models/recommend/{task_type}")
-        async def cerebras_model_recommend(task_type: str):
-            """Get Cerebras model recommendations for task type"""
-            try:
-                recommendations = get_model_recommendations(task_type)
-                return recommendations
-                
-            except Exception as e:
-                logger.error("Model recommendation failed", task_type=task_type, error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.get("/cerebras/metrics")
-        async def cerebras_metrics(window_minutes: int = 60):
-            """Get Cerebras performance metrics"""
-            await self.initialize()
-            try:
-                metrics = self.helpers['cerebras'].get_performance_metrics(window_minutes)
-                return metrics
-                
-            except Exception as e:
-                logger.error("Failed to get metrics", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
+        # Check audio components concurrently; latency is the slowest check, not the sum
+        checked = [name for name, component in self.audio_components.items() if hasattr(component, 'health_check')]
+        results = await asyncio.gather(
+            *(self.audio_components[name].health_check() for name in checked),
+            return_exceptions=True
+        )
+        health_by_name = dict(zip(checked, results))
         
-        # Audio-First System Endpoints
+        for component_name in self.audio_components:
+            health = health_by_name.get(component_name, {"status": "available"})
+            if isinstance(health, Exception):
+                health = {"status": "error", "error": str(health)}
+            health_status["components"][component_name] = health
         
-        @self.app.post("/audio/transcribe")
-        async def transcribe_audio(file_path: str, options: Dict[str, Any] = None):
-            """Transcribe audio file with AssemblyAI"""
-            await self.initialize()
-            try:
-                if not self.audio_components.get('assemblyai'):
-                    raise HTTPException(status_code=503, detail="AssemblyAI not available")
-                
-                result = await self.audio_components['assemblyai'].transcribe_audio_file(
-                    file_path, options or {}
-                )
-                return result
-                
-            except Exception as e:
-                logger.error("Audio transcription failed", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/audio/realtime/start")
-        async def start_realtime_transcription():
-            """Start real-time audio transcription"""
-            await self.initialize()
-            try:
-                if not self.audio_components.get('assemblyai'):
-                    raise HTTPException(status_code=503, detail="AssemblyAI not available")
-                
-                def on_transcript(data):
-                    logger.info("Real-time transcript", text=data.get('text', '')[:50])
-                
-                started = await self.audio_components['assemblyai'].start_realtime_transcription(on_transcript)
-                return {"started": started, "status": "real-time transcription active"}
-                
-            except Exception as e:
-                logger.error("Failed to start real-time transcription", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/maya/connect")
-        async def connect_to_maya(credentials: Dict[str, Any] = None):
-            """Connect to Maya via audio bridge"""
-            await self.initialize()
-            try:
-                if not self.audio_components.get('maya_bridge'):
-                    raise HTTPException(status_code=503, detail="Maya Audio Bridge not available")
-                
-                connected = await self.audio_components['maya_bridge'].connect_to_maya(credentials)
-                
-                if connected:
-                    state = await self.audio_components['maya_bridge'].get_maya_interface_state()
-                    return {"connected": True, "session_id": state.get('session_id'), "state": state}
-                else:
-                    return {"connected": False, "error": "Failed to connect to Maya"}
-                
-            except Exception as e:
-                logger.error("Maya connection failed", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/maya/send_message")
-        async def send_message_to_maya(message: str, use_tts: bool = True, wait_for_response: bool = True):
-            """Send message to Maya with optional TTS"""
-            await self.initialize()
-            try:
-                if not self.audio_components.get('maya_bridge'):
-                    raise HTTPException(status_code=503, detail="Maya Audio Bridge not available")
-                
-                response = await self.audio_components['maya_bridge'].send_message_to_maya(
-                    message, use_tts, wait_for_response
-                )
-                return response
-                
-            except Exception as e:
-                logger.error("Failed to send message to Maya", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/conversation/create")
-        async def create_conversation_thread(thread_type: str, title: str, platform_data: Dict[str, Any]):
-            """Create conversation thread in Redis"""
-            await self.initialize()
-            try:
-                if not self.audio_components.get('redis'):
-                    raise HTTPException(status_code=503, detail="Redis not available")
-                
-                from helpers.redis_helper import ThreadType
-                thread_type_enum = ThreadType(thread_type)
-                
-                thread = await self.audio_components['redis'].create_thread(
-                    thread_type_enum, title, platform_data
-                )
-                
-                return {
-                    "thread_id": thread.id,
-                    "type": thread.type.value,
-                    "title": thread.title,
-                    "created_at": thread.created_at.isoformat()
-                }
-                
-            except Exception as e:
-                logger.error("Failed to create conversation thread", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/conversation/{thread_id}/message")
-        async def add_conversation_message(thread_id: str, role: str, content: str, platform: str, metadata: Dict[str, Any] = None):
-            """Add message to conversation thread"""
-            await self.initialize()
-            try:
-                if not self.audio_components.get('redis'):
-                    raise HTTPException(status_code=503, detail="Redis not available")
-                
-                from helpers.redis_helper import MessageRole
-                role_enum = MessageRole(role)
-                
-                message = await self.audio_components['redis'].add_message(
-                    thread_id, role_enum, content, platform, metadata or {}
-                )
-                
-                if message:
-                    return {
-                        "message_id": message.id,
-                        "thread_id": message.thread_id,
-                        "role": message.role.value,
-                        "timestamp": message.timestamp.isoformat()
-                    }
-                else:
-                    raise HTTPException(status_code=404, detail="Thread not found")
-                
-            except Exception as e:
-                logger.error("Failed to add conversation message", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.get("/conversation/{thread_id}/context")
-        async def get_conversation_context(thread_id: str, max_messages: int = 10):
-            """Get conversation context"""
-            await self.initialize()
-            try:
-                if not self.audio_components.get('redis'):
-                    raise HTTPException(status_code=503, detail="Redis not available")
-                
-                context = await self.audio_components['redis'].get_conversation_context(
-                    thread_id, max_messages
-                )
-                return context
-                
-            except Exception as e:
-                logger.error("Failed to get conversation context", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/stream/start")
-        async def start_live_stream(platform: str, config: Dict[str, Any]):
-            """Start live stream"""
-            await self.initialize()
-            try:
-                if not self.audio_components.get('live_streaming'):
-                    raise HTTPException(status_code=503, detail="Live Streaming not available")
-                
-                from helpers.live_streaming_coordinator import StreamPlatform
-                platform_enum = StreamPlatform(platform)
-                
-                result = await self.audio_components['live_streaming'].start_stream(
-                    platform_enum, config
-                )
-                return result
-                
-            except Exception as e:
-                logger.error("Failed to start live stream", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.get("/stream/{stream_id}/status")
-        async def get_stream_status(stream_id: str):
-            """Get live stream status"""
-            await self.initialize()
-            try:
-                if not self.audio_components.get('live_streaming'):
-                    raise HTTPException(status_code=503, detail="Live Streaming not available")
-                
-                status = await self.audio_components['live_streaming'].get_stream_status(stream_id)
-                return status
-                
-            except Exception as e:
-                logger.error("Failed to get stream status", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/stream/{stream_id}/highlights")
-        async def get_stream_highlights(stream_id: str, time_window: int = 300):
-            """Get key moments from live stream"""
-            await self.initialize()
-            try:
-                if not self.audio_components.get('live_streaming'):
-                    raise HTTPException(status_code=503, detail="Live Streaming not available")
-                
-                highlights = await self.audio_components['live_streaming'].identify_key_moments(
-                    stream_id, time_window
-                )
-                return {"highlights": highlights, "count": len(highlights)}
-                
-            except Exception as e:
-                logger.error("Failed to get stream highlights", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/workflow/twitter_mention")
-        async def execute_twitter_mention_workflow(mention_data: Dict[str, Any], config: Dict[str, Any] = None):
-            """Execute Twitter mention response workflow"""
-            await self.initialize()
-            try:
-                if not self.audio_orchestrator:
-                    raise HTTPException(status_code=503, detail="Audio Orchestrator not available")
-                
-                result = await self.audio_orchestrator.execute_twitter_mention_workflow(
-                    mention_data, config or {}
-                )
-                return result
-                
-            except Exception as e:
-                logger.error("Twitter mention workflow failed", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/workflow/audio_conversation")
-        async def execute_audio_conversation_workflow(audio_data: bytes, context: Dict[str, Any] = None):
-            """Execute audio conversation workflow"""
-            await self.initialize()
-            try:
-                if not self.audio_orchestrator:
-                    raise HTTPException(status_code=503, detail="Audio Orchestrator not available")
-                
-                result = await self.audio_orchestrator.execute_audio_conversation_workflow(
-                    audio_data, context or {}
-                )
-                return result
-                
-            except Exception as e:
-                logger.error("Audio conversation workflow failed", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.get("/workflow/{workflow_id}/status")
-        async def get_workflow_status(workflow_id: str):
-            """Get workflow status"""
-            await self.initialize()
-            try:
-                if not self.audio_orchestrator:
-                    raise HTTPException(status_code=503, detail="Audio Orchestrator not available")
-                
-                status = await self.audio_orchestrator.get_workflow_status(workflow_id)
-                return status
-                
-            except Exception as e:
-                logger.error("Failed to get workflow status", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.get("/audio/system/health")
-        async def audio_system_health():
-            """Check audio system health"""
-            await self.initialize()
-            
-            health_status = {
-                "audio_system_initialized": self._audio_system_initialized,
-                "components": {},
-                "orchestrator": bool(self.audio_orchestrator)
+        return health_status
+    
+    async def _route_process_maya_intent(self, intent_data: Dict[str, Any]):
+        """Process intent from Maya API"""
+        try:
+            # Call Maya API stub
+            maya_response = await call_maya("process_intent", intent_data)
+            
+            # Route to appropriate handler
+            return await self._route_maya_response(maya_response)
+            
+        except Exception as e:
+            logger.error("Failed to process Maya intent", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_create_campaign(self, campaign: Campaign):
+        """Create a new campaign"""
+        try:
+            # Process through Maya API
+            maya_response = await call_maya("create_campaign", campaign.dict())
+            
+            # Execute campaign across platforms
+            results = await self._execute_campaign(campaign)
+            
+            return {
+                "campaign_id": campaign.id,
+                "maya_response": maya_response,
+                "platform_results": results
             }
             
-            # Check each audio component
-            for component_name, component in self.audio_components.items():
-                try:
-                    if hasattr(component, 'health_check'):
-                        health = await component.health_check()
-                        health_status["components"][component_name] = health
-                    else:
-                        health_status["components"][component_name] = {"status": "available"}
-                except Exception as e:
-                    health_status["components"][component_name] = {"status": "error", "error": str(e)}
-            
-            return health_status
-        
-        @self.app.post("/maya/intent")
-        async def process_maya_intent(intent_data: Dict[str, Any]):
-            """Process intent from Maya API"""
-            try:
-                # Call Maya API stub
-                maya_response = await call_maya("process_intent", intent_data)
-                
-                # Route to appropriate handler
-                return await self._route_maya_response(maya_response)
-                
-            except Exception as e:
-                logger.error("Failed to process Maya intent", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
-        
-        @self.app.post("/campaign/create")
-        async def create_campaign(campaign: Campaign):
-            """Create a new campaign"""
-            try:
-                # Process through Maya API
-                maya_response = await call_maya("create_campaign", campaign.dict())
-                
-                # Execute campaign across platforms
-                results = await self._execute_campaign(campaign)
-                
-                return {
-                    "campaign_id": campaign.id,
-                    "maya_response": maya_response,
-                    "platform_results": results
-                }
-                
-            except Exception as e:
-                logger.error("Failed to create campaign", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e))
+        except Exception as e:
+            logger.error("Failed to create campaign", error=str(e))
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    async def _route_orchestrator_stats(self):
+        """Get orchestrator routing and cache counters"""
+        return {
+            "intent_router": self._intent_router.get_stats(),
+            "response_cache": self._response_cache.stats,
+            "adapters": self._adapter_pool.get_stats(),
+            "concurrency": {
+                "in_flight": self._in_flight,
+                "queue_depth": self._queue_depth,
+                "max_queue_depth": self._max_queue_depth,
+                "rejected": self._rejected
+            }
+        }
     
-    async def process_request(self, request: OrchestrationRequest, background_tasks: BackgroundTasks) -> OrchestrationResponse:
+    async def process_request(self, request: OrchestrationRequest) -> OrchestrationResponse:
         """
         Process an orchestration request by routing to appropriate components
+        
+        Raises HTTPException(503) when too many requests are already waiting.
         """
-        request_id = f"req_{datetime.utcnow().timestamp()}"
+        if self._queue_depth >= self._max_queue_depth:
+            self._rejected += 1
+            logger.warning("Orchestrator at capacity, rejecting request", queue_depth=self._queue_depth)
+            raise HTTPException(status_code=503, detail="Orchestrator at capacity, retry shortly",
+                                headers={"Retry-After": "1"})
+        
+        self._queue_depth += 1
+        try:
+            await self._gate.acquire()
+        finally:
+            self._queue_depth -= 1
         
+        self._in_flight += 1
         try:
-            logger.info("Processing orchestration request", 
-                       intent=request.intent, 
-                       platform=request.platform,
-                       request_id=request_id)
+            return await self._process_request(request)
+        finally:
+            self._in_flight -= 1
+            self._gate.release()
+    
+    async def _process_request(self, request: OrchestrationRequest) -> OrchestrationResponse:
+        """Intent analysis, routing and response assembly for one admitted request"""
+        request_id = f"req_{_REQ_ID_PREFIX}{next(_REQ_COUNTER):x}"
+        preflight: Optional[asyncio.Task] = None
+        
+        try:
+            # Warm up the named adapter (auth refresh etc.) while Maya analyzes the intent
+            if request.platform in self.adapters:
+                preflight = asyncio.create_task(self._preflight_adapter(request.platform))
             
-            # Analyze intent with Maya API
-            maya_response = await call_maya("analyze_intent", {
+            if self._info_enabled:
+                self._req_log.info("Processing orchestration request", 
+                                   intent=request.intent, 
+                                   platform=request.platform,
+                                   request_id=request_id)
+            
+            await self._ensure_cerebras_config()
+            
+            # Analyze intent with Maya API (batched with concurrent requests when serving)
+            intent_payload = {
                 "intent": request.intent,
                 "context": request.content or {},
                 "platform": request.platform
-            })
+            }
+            # Deterministic intents that Maya has already confirmed skip the round trip
+            maya_response = await self._intent_router.route(request.intent, request.platform, request.content)
+            if maya_response is None:
+                if self._intent_batcher is not None and self._intent_batcher.running:
+                    maya_response = (await self._intent_batcher.submit([intent_payload]))[0]
+                else:
+                    maya_response = await call_maya("analyze_intent", intent_payload)
+                await self._intent_router.remember(request.intent, request.platform, request.content, maya_response)
+            
+            if preflight is not None:
+                # Only social posts go to the requested platform's adapter
+                if maya_response.get("intent_type") == "social_post":
+                    await preflight
+                else:
+                    preflight.cancel()
             
             # Route based on intent and platform
             result = await self._route_request(request, maya_response)
             
-            # Schedule background tasks if needed
+            # High-priority requests are logged off the response path by _log_drain
             if request.priority > 5:
-                background_tasks.add_task(self._log_high_priority_request, request, result)
+                self._logq.put_nowait((request, result))
             
             return OrchestrationResponse(
                 success=True,
@@ -711,111 +1169,224 @@ class MayaOrchestrator:
                 timestamp=datetime.utcnow(),
                 request_id=request_id
             )
+        finally:
+            if preflight is not None and not preflight.done():
+                preflight.cancel()
+    
+    async def _preflight_adapter(self, platform: str):
+        """Run an adapter's preflight; failures are left for the real call to surface"""
+        try:
+            await self.adapters[platform].preflight()
+        except Exception as e:
+            logger.warning("Adapter preflight failed", platform=platform, error=str(e))
     
     async def _route_request(self, request: OrchestrationRequest, maya_response: Dict[str, Any]) -> Dict[str, Any]:
         """Route request to appropriate adapter or helper with advanced Cerebras integration"""
-        
-        intent_type = maya_response.get("intent_type", "unknown")
+        handler = self._handlers.get(maya_response.get("intent_type", "unknown"), self._handle_default)
+        return await handler(request, maya_response)
+    
+    async def _handle_social_post(self, request: OrchestrationRequest, maya_response: Dict[str, Any]) -> Dict[str, Any]:
+        """Enhanced social media posting with Cerebras optimization"""
         target_platform = request.platform or maya_response.get("suggested_platform")
+        if target_platform not in self.adapters:
+            return await self._handle_default(request, maya_response)
         
-        if intent_type == "social_post" and target_platform in self.adapters:
-            # Enhanced social media posting with Cerebras optimization
-            adapter = self.adapters[target_platform]
-            
-            # Use Cerebras to optimize content for the platform
-            if request.content and request.content.get("content"):
-                from src.maya_cp.helpers.cerebras_helper import GenerationConfig
-                
-                # Get optimal model for social media content
-                optimal_model = self.helpers['cerebras'].select_optimal_model(
-                    f"Create {target_platform} content", 
-                    constraints={"max_latency_ms": 2000}
-                )
-                
-                # Generate optimized content
-                messages = [
-                    {"role": "system", "content": f"You are an expert {target_platform} content creator."},
-                    {"role": "user", "content": f"Optimize this content for {target_platform}: {request.content['content']}"}
-                ]
-                
-                config = GenerationConfig(
-                    model=optimal_model,
-                    max_tokens=280 if target_platform == "twitter" else 1000,
-                    temperature=0.8
-                )
-                
-                cerebras_result = await self.helpers['cerebras'].generate_text(messages, config)
-                
-                if cerebras_result.get("success"):
-                    request.content["content"] = cerebras_result["content"]
-                    request.content["ai_optimized"] = True
-                    request.content["model_used"] = optimal_model
-            
-            return await adapter.create_post(request.content)
+        # Use Cerebras to optimize content for the platform
+        if request.content and request.content.get("content"):
+            # Get optimal model for social media content
+            optimal_model = self.helpers['cerebras'].select_optimal_model(
+                f"Create {target_platform} content", 
+                constraints={"max_latency_ms": 2000}
+            )
             
-        elif intent_type == "ai_generation":
-            # Advanced AI generation with dynamic model selection
-            cerebras_helper = self.helpers['cerebras']
-            
-            # Determine optimal model based on request complexity
-            task_description = str(request.content)
-            optimal_model = cerebras_helper.select_optimal_model(task_description)
-            
-            # Use advanced generation with tools if needed
-            if request.content.get("use_tools", False):
-                messages = [{"role": "user", "content": request.content.get("prompt", "")}]
-                tools = request.content.get("tools")
-                
-                from src.maya_cp.helpers.cerebras_helper import GenerationConfig
-                config = GenerationConfig(model=optimal_model)
-                
-                return await cerebras_helper.call_with_tools(messages, tools, config)
-            else:
-                # Standard generation with optimal model
-                request.content["model"] = optimal_model
-                return await cerebras_helper.process_request(request.content)
-            
-        elif intent_type == "content_analysis":
-            # Use Cerebras embeddings for content analysis
-            cerebras_helper = self.helpers['cerebras']
-            
-            content_texts = request.content.get("texts", [])
-            if content_texts:
-                from src.maya_cp.helpers.cerebras_helper import EmbeddingConfig
-                config = EmbeddingConfig(task_type="retrieval_query")
-                
-                embeddings_result = await cerebras_helper.generate_embeddings(content_texts, config)
-                
-                return {
-                    "status": "analyzed",
-                    "embeddings": embeddings_result,
-                    "analysis_type": "semantic_similarity"
-                }
+            # Generate optimized content
+            platform_message = PLATFORM_SYS_PROMPT.get(target_platform) or {
+                "role": "system", "content": f"platform={target_platform}"
+            }
+            messages = [
+                CANONICAL_SYS_MESSAGE,
+                platform_message,
+                {"role": "user", "content": f"Optimize this content for {target_platform}: {request.content['content']}"}
+            ]
             
-        elif intent_type == "campaign_management":
-            # Handle campaign operations with AI assistance
-            return await self._handle_campaign_operation(request, maya_response)
+            config = _platform_generation_config(target_platform, optimal_model)
             
-        elif intent_type == "fine_tuning":
-            # Handle fine-tuning requests
-            cerebras_helper = self.helpers['cerebras']
+            cache_payload = {
+                "schema": _SOCIAL_OPTIMIZE_CACHE_VERSION,
+                "platform": target_platform,
+                "model": optimal_model,
+                "content": request.content["content"]
+            }
+            cerebras_result = await self._cached_generate(
+                "social_optimize", cache_payload, "content", messages, config
+            )
             
-            from src.maya_cp.helpers.cerebras_helper import FineTuningConfig
-            config_data = request.content.get("fine_tuning_config", {})
-            config = FineTuningConfig(**config_data)
+            if cerebras_result.get("success"):
+                request.content = {
+                    **request.content,
+                    "content": cerebras_result["content"],
+                    "ai_optimized": True,
+                    "model_used": optimal_model
+                }
+        
+        async with self._adapter_pool.lease(target_platform) as adapter:
+            return await adapter.create_post(request.content)
+    
+    async def _handle_ai_generation(self, request: OrchestrationRequest, maya_response: Dict[str, Any]) -> Dict[str, Any]:
+        """Advanced AI generation with dynamic model selection"""
+        cerebras_helper = self.helpers['cerebras']
+        
+        # Determine optimal model based on request complexity
+        optimal_model = self._select_model_for_content(request.content)
+        
+        # Use advanced generation with tools if needed
+        if request.content.get("use_tools", False):
+            messages = [CANONICAL_SYS_MESSAGE, {"role": "user", "content": request.content.get("prompt", "")}]
+            tools = request.content.get("tools")
             
-            dataset_path = request.content.get("dataset_path")
-            return await cerebras_helper.start_fine_tuning(config, dataset_path)
+            config = GenerationConfig(model=optimal_model)
             
+            return await cerebras_helper.call_with_tools(messages, tools, config)
+        
+        # Standard generation with optimal model
+        request.content["model"] = optimal_model
+        cached = await self._response_cache.get("cerebras_process", request.content)
+        if cached is not None:
+            return cached
+        
+        result = await cerebras_helper.process_request(request.content)
+        await self._cache_result("cerebras_process", request.content, result)
+        return result
+    
+    def _select_model_for_content(self, content: Dict[str, Any]) -> str:
+        """
+        select_optimal_model memoized by request shape
+        
+        The shape is the set of content keys plus the prompt length in 256-char
+        buckets. Only the first request of each shape pays for str(content) and
+        selection. Tool calls always get a full selection.
+        """
+        cerebras_helper = self.helpers['cerebras']
+        if content.get("use_tools", False):
+            return cerebras_helper.select_optimal_model(str(content))
+        
+        prompt = content.get("prompt", "")
+        fingerprint = (frozenset(content), len(prompt) // 256 if isinstance(prompt, str) else -1)
+        model = self._model_choices.get(fingerprint)
+        if model is None:
+            model = cerebras_helper.select_optimal_model(str(content))
+            if len(self._model_choices) >= 2048:
+                self._model_choices.clear()
+            self._model_choices[fingerprint] = model
+        return model
+    
+    async def _handle_content_analysis(self, request: OrchestrationRequest, maya_response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Use Cerebras embeddings for content analysis"""
+        content_texts = request.content.get("texts", [])
+        if not content_texts:
+            return None
+        
+        config = EmbeddingConfig(task_type="retrieval_query")
+        
+        cache_payload = {"texts": content_texts, "config": {"task_type": "retrieval_query"}}
+        embeddings_result = await self._response_cache.get("cerebras_embeddings", cache_payload)
+        if embeddings_result is None:
+            embeddings_result = await self._generate_embeddings_batched(content_texts, config)
+            await self._cache_result("cerebras_embeddings", cache_payload, embeddings_result)
+        
+        return {
+            "status": "analyzed",
+            "embeddings": embeddings_result,
+            "analysis_type": "semantic_similarity"
+        }
+    
+    async def _handle_fine_tuning(self, request: OrchestrationRequest, maya_response: Dict[str, Any]) -> Dict[str, Any]:
+        """Start a fine-tuning job from the request payload"""
+        config_data = request.content.get("fine_tuning_config", {})
+        config = _build_config(FineTuningConfig, config_data)
+        
+        dataset_path = request.content.get("dataset_path")
+        return await self.helpers['cerebras'].start_fine_tuning(config, dataset_path)
+    
+    async def _handle_default(self, request: OrchestrationRequest, maya_response: Dict[str, Any]) -> Dict[str, Any]:
+        """Default handling with intelligent routing"""
+        intent_type = maya_response.get("intent_type", "unknown")
+        return {
+            "status": "routed",
+            "intent_type": intent_type,
+            "maya_response": maya_response,
+            "suggested_model": get_model_recommendations(intent_type),
+            "message": "Request routed but no specific handler found"
+        }
+    
+    async def _generate_embeddings_batched(self, texts: List[str], config: Optional[EmbeddingConfig] = None) -> Dict[str, Any]:
+        """Embed texts in fixed-size batches, sending batches concurrently"""
+        cerebras_helper = self.helpers['cerebras']
+        batch_size = self.config.get('ai_services', {}).get('cerebras', {}).get('embed_batch_size', 64)
+        
+        if len(texts) <= batch_size:
+            return await cerebras_helper.generate_embeddings(texts, config)
+        
+        async def embed_batch(batch: List[str]) -> Dict[str, Any]:
+            async with self._embed_sem:
+                return await cerebras_helper.generate_embeddings(batch, config)
+        
+        results = await asyncio.gather(*(
+            embed_batch(texts[i:i + batch_size]) for i in range(0, len(texts), batch_size)
+        ))
+        
+        for result in results:
+            if not result.get("success", False):
+                return result
+        
+        embeddings = [embedding for result in results for embedding in result.get("embeddings", [])]
+        return {**results[0], "embeddings": embeddings, "count": len(embeddings)}
+    
+    async def _cached_generate(self, route: str, payload: Dict[str, Any], text_field: str,
+                               messages: List[Dict[str, Any]], config: Any) -> Dict[str, Any]:
+        """
+        generate_text behind the exact cache, plus near-match lookups while serving
+        
+        Near matches compare payload[text_field] only; every other payload field
+        (platform, model, schema) has to match exactly.
+        """
+        cache = self._semantic_cache
+        text = payload[text_field]
+        scope = {key: value for key, value in payload.items() if key != text_field}
+        cached = await (cache.get(route, payload, text, scope) if cache else self._response_cache.get(route, payload))
+        if cached is not None:
+            return cached
+        
+        result = await self.helpers['cerebras'].generate_text(messages, config)
+        if not isinstance(result, dict) or not result.get("success", False):
+            return result
+        
+        ttl = self.config.get('cache', {}).get('ttl', {}).get(route, 3600)
+        if cache:
+            await cache.set(route, payload, text, result, ttl, scope)
         else:
-            # Default handling with intelligent routing
-            return {
-                "status": "routed",
-                "intent_type": intent_type,
-                "maya_response": maya_response,
-                "suggested_model": get_model_recommendations(intent_type),
-                "message": "Request routed but no specific handler found"
-            }
+            await self._response_cache.set(route, payload, result, ttl)
+        return result
+    
+    async def _cache_result(self, route: str, payload: Dict[str, Any], result: Any):
+        """Cache a successful backend response using the route's configured TTL"""
+        if not isinstance(result, dict) or not result.get("success", False):
+            return
+        
+        ttl = self.config.get('cache', {}).get('ttl', {}).get(route, 300)
+        await self._response_cache.set(route, payload, result, ttl)
+    
+    async def _analyze_intents(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Batch handler for the intent batcher: one Maya analysis per payload"""
+        response = await call_maya("analyze_intent_batch", {"items": payloads})
+        return response.get("results", [])
+    
+    async def _embed_texts(self, texts: List[str]) -> List[Any]:
+        """Batch handler for the embeddings batcher: one vector per text"""
+        result = await self._generate_embeddings_batched(texts)
+        if not result.get("success", False):
+            raise RuntimeError(result.get("error", "Embedding generation failed"))
+        return result.get("embeddings", [])
     
     async def _route_maya_response(self, maya_response: Dict[str, Any]) -> Dict[str, Any]:
         """Route Maya API response to appropriate handlers"""
@@ -825,7 +1396,8 @@ class MayaOrchestrator:
         if response_type == "social_action":
             platform = maya_response.get("platform")
             if platform in self.adapters:
-                return await self.adapters[platform].execute_action(maya_response.get("action", {}))
+                async with self._adapter_pool.lease(platform) as adapter:
+                    return await adapter.execute_action(maya_response.get("action", {}))
         
         elif response_type == "ai_request":
             return await self.helpers['cerebras'].process_request(maya_response.get("request", {}))
@@ -833,18 +1405,24 @@ class MayaOrchestrator:
         return {"status": "processed", "original_response": maya_response}
     
     async def _execute_campaign(self, campaign: Campaign) -> Dict[str, Any]:
-        """Execute campaign across multiple platforms"""
-        results = {}
+        """Execute campaign across multiple platforms concurrently"""
+        platforms = [platform for platform in campaign.platforms if platform in self.adapters]
+        parallelism = asyncio.Semaphore(self.config.get('app', {}).get('campaign_parallelism', 8))
         
-        for platform in campaign.platforms:
-            if platform in self.adapters:
-                try:
-                    adapter = self.adapters[platform]
-                    result = await adapter.execute_campaign(campaign)
-                    results[platform] = {"success": True, "data": result}
-                except Exception as e:
-                    results[platform] = {"success": False, "error": str(e)}
-                    logger.error("Campaign execution failed", platform=platform, error=str(e))
+        async def run_one(platform) -> Any:
+            async with parallelism, self._adapter_pool.lease(platform) as adapter:
+                return await adapter.execute_campaign(campaign)
+        
+        # Platforms are independent, so latency is the slowest adapter rather than the sum
+        outcomes = await asyncio.gather(*(run_one(platform) for platform in platforms), return_exceptions=True)
+        
+        results = {}
+        for platform, outcome in zip(platforms, outcomes):
+            if isinstance(outcome, Exception):
+                results[platform] = {"success": False, "error": str(outcome)}
+                logger.error("Campaign execution failed", platform=platform, error=str(outcome))
+            else:
+                results[platform] = {"success": True, "data": outcome}
         
         return results
     
@@ -868,12 +1446,14 @@ class MayaOrchestrator:
         
         return {"status": "unknown_operation", "operation": operation}
     
-    async def _log_high_priority_request(self, request: OrchestrationRequest, result: Dict[str, Any]):
-        """Background task for logging high-priority requests"""
-        logger.info("High priority request processed", 
-                   intent=request.intent,
-                   result_status=result.get("status"),
-                   priority=request.priority)
+    async def _sse_stream(self, chunks: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+        """Frame streamed Cerebras chunks as server-sent events"""
+        try:
+            async for chunk in chunks:
+                yield b"data: " + orjson.dumps(chunk, default=str) + b"\n\n"
+        except Exception as e:
+            logger.error("Cerebras stream failed", error=str(e))
+            yield b"data: " + orjson.dumps({"success": False, "error": str(e), "is_final": True}) + b"\n\n"
     
     def run(self, host: str = "0.0.0.0", port: int = 8000):
         """Run the orchestrator server"""
@@ -886,17 +1466,27 @@ class MayaOrchestrator:
         
         logger.info("Starting Maya Orchestrator", host=host, port=port, workers=workers)
         
+        # Uvicorn only honours workers > 1 when given an import string, so each
+        # worker process imports its own app (and builds HTTP clients in the lifespan)
         uvicorn.run(
-            self.app,
+            "hub.orchestrator:app",
             host=host,
             port=port,
             workers=workers,
+            loop="auto",  # uvloop when installed
+            http="auto",  # httptools when installed
             log_config=None  # Use our structured logging
         )
 
 
-# Global orchestrator instance
+# Global orchestrator instance; async setup happens in the app's lifespan
 orchestrator = MayaOrchestrator()
+app = orchestrator.app
+
+
+def create_app() -> FastAPI:
+    """Application factory for launchers that prefer --factory"""
+    return orchestrator.app
 
 
 if __name__ == "__main__":
@@ -0,0 +1,188 @@
+"""
+Maya Control Plane Response Cache
+
+Two-tier cache for deterministic backend calls: an in-process LRU in front
+of Redis working memory. Keys are a stable hash of the request payload.
+SemanticCache adds embedding-similarity lookups for near-duplicate prompts.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+from hub.logger import get_logger
+
+
+logger = get_logger("response_cache")
+
+# Local copies of Redis hits are short-lived; Redis owns the real expiry
+REDIS_HIT_LOCAL_TTL = 60
+
+
+def cache_key(namespace: str, payload: Any) -> str:
+    """Stable key for a JSON-serializable payload"""
+    digest = hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+    return f"cache:{namespace}:{digest}"
+
+
+class ResponseCache:
+    """
+    Response cache keyed by request content
+
+    Features:
+    - Bounded in-process LRU with per-entry expiry
+    - Optional shared Redis tier (RedisConversationHelper working memory)
+    - Per-namespace hit/miss counters
+    """
+
+    def __init__(self, redis_helper: Any = None, max_entries: int = 1024):
+        self.redis_helper = redis_helper
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    async def get(self, namespace: str, payload: Any) -> Optional[Dict[str, Any]]:
+        """Return the cached response for payload, or None"""
+        key = cache_key(namespace, payload)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._record(namespace, "hits")
+                return value
+            del self._entries[key]
+
+        if self.redis_helper is not None:
+            value = await self.redis_helper.get_working_memory(key)
+            if value is not None:
+                # Shared tier hit: keep a short local copy for hot keys
+                self._store_local(key, value, REDIS_HIT_LOCAL_TTL)
+                self._record(namespace, "hits")
+                return value
+
+        self._record(namespace, "misses")
+        return None
+
+    async def set(self, namespace: str, payload: Any, value: Dict[str, Any], ttl: int):
+        """Store a response under payload for ttl seconds"""
+        if ttl <= 0:
+            return
+
+        key = cache_key(namespace, payload)
+        self._store_local(key, value, ttl)
+
+        if self.redis_helper is not None:
+            await self.redis_helper.set_working_memory(key, value, ttl)
+
+    def _store_local(self, key: str, value: Dict[str, Any], ttl: int):
+        """Insert into the LRU, evicting the oldest entry when full"""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _record(self, namespace: str, outcome: str):
+        """Count a hit or miss and emit it as a debug metric"""
+        counters = self.stats.setdefault(namespace, {"hits": 0, "misses": 0})
+        counters[outcome] += 1
+        logger.debug("cache_hit" if outcome == "hits" else "cache_miss", namespace=namespace)
+
+
+class SemanticCache:
+    """
+    Near-duplicate cache layered over ResponseCache
+
+    Exact payload matches are served by the underlying ResponseCache. On an
+    exact miss the lookup text is embedded and compared (cosine similarity)
+    against recent entries in the same namespace and scope; anything at or
+    above threshold is treated as a hit. The scope carries the rest of the
+    payload (platform, model, ...) so a near match never crosses those.
+    Embedding failures degrade to a miss.
+    """
+
+    def __init__(self, exact: ResponseCache, embed_fn: Callable[[List[str]], Awaitable[List[Any]]],
+                 threshold: float = 0.93, max_entries: int = 512):
+        self.exact = exact
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: Dict[str, "OrderedDict[str, Tuple[float, np.ndarray, Dict[str, Any]]]"] = {}
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    async def get(self, namespace: str, payload: Any, text: str, scope: Any = None) -> Optional[Dict[str, Any]]:
+        """Return an exact or semantically equivalent cached response, or None"""
+        value = await self.exact.get(namespace, payload)
+        if value is not None:
+            return value
+
+        entries = self._entries.get(cache_key(namespace, scope))
+        if not entries:
+            return None
+
+        vector = await self._embed(text)
+        if vector is None:
+            return None
+
+        now = time.monotonic()
+        best_score, best_value = -1.0, None
+        for key, (expires_at, candidate, candidate_value) in list(entries.items()):
+            if expires_at <= now:
+                del entries[key]
+                continue
+            score = float(np.dot(vector, candidate))
+            if score > best_score:
+                best_score, best_value = score, candidate_value
+
+        if best_value is not None and best_score >= self.threshold:
+            self.exact.stats[namespace]["semantic_hits"] = self.exact.stats[namespace].get("semantic_hits", 0) + 1
+            logger.debug("cache_semantic_hit", namespace=namespace, similarity=round(best_score, 4))
+            return best_value
+
+        return None
+
+    async def set(self, namespace: str, payload: Any, text: str, value: Dict[str, Any], ttl: int,
+                  scope: Any = None):
+        """Store a response for exact and near-match lookups"""
+        if ttl <= 0:
+            return
+
+        await self.exact.set(namespace, payload, value, ttl)
+
+        vector = await self._embed(text)
+        if vector is None:
+            return
+
+        entries = self._entries.setdefault(cache_key(namespace, scope), OrderedDict())
+        entries[cache_key(namespace, payload)] = (time.monotonic() + ttl, vector, value)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Unit-normalized embedding for text, memoized so get+set embed once"""
+        vector = self._vectors.get(text)
+        if vector is not None:
+            self._vectors.move_to_end(text)
+            return vector
+
+        try:
+            embeddings = await self.embed_fn([text])
+            vector = np.asarray(embeddings[0], dtype=np.float32)
+        except Exception as e:
+            logger.debug("Semantic cache embedding failed", error=str(e))
+            return None
+
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        vector /= norm
+
+        self._vectors[text] = vector
+        while len(self._vectors) > self.max_entries:
+            self._vectors.popitem(last=False)
+        return vector
@@ -6,14 +6,18 @@ Handles campaign scheduling, content publishing, and periodic maintenance tasks.
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import heapq
+import itertools
+import os
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional, Callable
 import uuid
 from enum import Enum
 from dataclasses import dataclass, field
 
-from celery import Celery
-from celery.schedules import crontab
+import orjson
+import redis.asyncio as aioredis
 import structlog
 
 from stubs.schemas import Campaign, Post, Event
@@ -22,6 +26,19 @@ from hub.logger import get_logger
 
 logger = get_logger("scheduler")
 
+# MAYA_SIM=1 makes the placeholder task bodies yield as if doing I/O
+SIMULATE = os.getenv("MAYA_SIM", "0") == "1"
+
+# Task ids are UUID-shaped but counter-based: (start time << 22 | pid) in the high
+# 64 bits keeps them unique across processes without reading /dev/urandom
+_TASK_ID_BASE = ((int(time.time()) << 22) | (os.getpid() & 0x3FFFFF)) & 0xFFFFFFFFFFFFFFFF
+_TASK_COUNTER = itertools.count()
+
+
+def _next_task_id() -> str:
+    """Next unique task id for this process"""
+    return str(uuid.UUID(int=(_TASK_ID_BASE << 64) | next(_TASK_COUNTER)))
+
 
 class TaskStatus(Enum):
     """Task execution status"""
@@ -43,7 +60,7 @@ class TaskPriority(Enum):
 @dataclass
 class ScheduledTask:
     """Represents a scheduled task"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_next_task_id)
     name: str = ""
     function: str = ""
     args: List[Any] = field(default_factory=list)
@@ -58,27 +75,215 @@ class ScheduledTask:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+def _due_score(scheduled_time: datetime) -> float:
+    """Epoch seconds for a naive-UTC scheduled time"""
+    return scheduled_time.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _task_from_dict(data: Dict[str, Any]) -> ScheduledTask:
+    """Rebuild a ScheduledTask from its orjson-serialized form"""
+    return ScheduledTask(
+        **{
+            **data,
+            "scheduled_time": datetime.fromisoformat(data["scheduled_time"]),
+            "created_at": datetime.fromisoformat(data["created_at"]),
+            "updated_at": datetime.fromisoformat(data["updated_at"]),
+            "priority": TaskPriority(data["priority"]),
+            "status": TaskStatus(data["status"]),
+        }
+    )
+
+
+class InMemoryTaskStore:
+    """
+    In-process task storage: a heap of (due epoch seconds, task id) plus counters
+    
+    Same (async) interface as RedisTaskStore, without a broker round trip per
+    task. Only suitable when a single process owns the schedule.
+    """
+    
+    def __init__(self):
+        self.tasks: Dict[str, ScheduledTask] = {}
+        self._heap: List[tuple] = []
+        self._counters: Dict[str, int] = {}
+    
+    async def add(self, task: ScheduledTask):
+        """Store a new task and queue it by due time"""
+        self.tasks[task.id] = task
+        heapq.heappush(self._heap, (_due_score(task.scheduled_time), task.id))
+        for key in (f"status:{task.status.value}", f"priority:{task.priority.value}", "total"):
+            self._counters[key] = self._counters.get(key, 0) + 1
+    
+    async def update(self, task: ScheduledTask, previous_status: TaskStatus, requeue: bool = False):
+        """Record a status transition, optionally queueing the task again"""
+        self.tasks[task.id] = task
+        if previous_status != task.status:
+            self._counters[f"status:{previous_status.value}"] -= 1
+            key = f"status:{task.status.value}"
+            self._counters[key] = self._counters.get(key, 0) + 1
+        if requeue:
+            heapq.heappush(self._heap, (_due_score(task.scheduled_time), task.id))
+    
+    async def get(self, task_id: str) -> Optional[ScheduledTask]:
+        """Look up a task by id"""
+        return self.tasks.get(task_id)
+    
+    async def pop_due(self, now: float, limit: int = 100) -> List[ScheduledTask]:
+        """Remove and return up to limit tasks due at or before now"""
+        due = []
+        while self._heap and self._heap[0][0] <= now and len(due) < limit:
+            _, task_id = heapq.heappop(self._heap)
+            if task_id in self.tasks:
+                due.append(self.tasks[task_id])
+        return due
+    
+    def next_due(self) -> Optional[float]:
+        """Epoch seconds of the earliest queued task, if any"""
+        return self._heap[0][0] if self._heap else None
+    
+    async def stats(self) -> Dict[str, Any]:
+        """Counters maintained on every transition, plus the queue depth"""
+        status_counts, priority_counts = {}, {}
+        for key, value in self._counters.items():
+            kind, _, name = key.partition(":")
+            if kind == "status":
+                status_counts[name] = value
+            elif kind == "priority":
+                priority_counts[int(name)] = value
+        
+        return {
+            "total_tasks": self._counters.get("total", 0),
+            "queued_tasks": len(self._heap),
+            "status_breakdown": status_counts,
+            "priority_breakdown": priority_counts
+        }
+
+
+class RedisTaskStore:
+    """
+    Redis-backed task storage for the scheduler
+    
+    Layout:
+    - maya:sched:task:<id>  task JSON
+    - maya:sched:due        ZSET of task ids scored by due epoch seconds
+    - maya:sched:stats      HASH of per-status / per-priority counters
+    """
+    
+    DUE_KEY = "maya:sched:due"
+    STATS_KEY = "maya:sched:stats"
+    TASK_KEY = "maya:sched:task:{}"
+    
+    # Claim due ids atomically so concurrent pollers never dispatch a task twice
+    _POP_DUE_SCRIPT = """
+    local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+    if #ids > 0 then
+        redis.call('ZREM', KEYS[1], unpack(ids))
+    end
+    return ids
+    """
+    
+    def __init__(self, redis_url: str, task_ttl: int = 7 * 24 * 3600):
+        # Async client: every store call runs inside the scheduler's event loop
+        self.client = aioredis.Redis.from_url(redis_url)
+        self.task_ttl = task_ttl
+        self._pop_due = self.client.register_script(self._POP_DUE_SCRIPT)
+    
+    async def add(self, task: ScheduledTask):
+        """Store a new task and queue it by due time"""
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self.TASK_KEY.format(task.id), orjson.dumps(task), ex=self.task_ttl)
+        pipe.zadd(self.DUE_KEY, {task.id: _due_score(task.scheduled_time)})
+        pipe.hincrby(self.STATS_KEY, f"status:{task.status.value}", 1)
+        pipe.hincrby(self.STATS_KEY, f"priority:{task.priority.value}", 1)
+        pipe.hincrby(self.STATS_KEY, "total", 1)
+        await pipe.execute()
+    
+    async def update(self, task: ScheduledTask, previous_status: TaskStatus, requeue: bool = False):
+        """Persist a task after a status transition, optionally queueing it again"""
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self.TASK_KEY.format(task.id), orjson.dumps(task), ex=self.task_ttl)
+        if previous_status != task.status:
+            pipe.hincrby(self.STATS_KEY, f"status:{previous_status.value}", -1)
+            pipe.hincrby(self.STATS_KEY, f"status:{task.status.value}", 1)
+        if requeue:
+            pipe.zadd(self.DUE_KEY, {task.id: _due_score(task.scheduled_time)})
+        await pipe.execute()
+    
+    async def get(self, task_id: str) -> Optional[ScheduledTask]:
+        """Load a task by id"""
+        data = await self.client.get(self.TASK_KEY.format(task_id))
+        return _task_from_dict(orjson.loads(data)) if data else None
+    
+    async def pop_due(self, now: float, limit: int = 100) -> List[ScheduledTask]:
+        """Claim and load up to limit tasks due at or before now"""
+        task_ids = await self._pop_due(keys=[self.DUE_KEY], args=[now, limit])
+        if not task_ids:
+            return []
+        
+        payloads = await self.client.mget([self.TASK_KEY.format(task_id.decode()) for task_id in task_ids])
+        return [_task_from_dict(orjson.loads(payload)) for payload in payloads if payload]
+    
+    async def stats(self) -> Dict[str, Any]:
+        """Counters maintained on every transition, plus the queue depth"""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hgetall(self.STATS_KEY)
+        pipe.zcard(self.DUE_KEY)
+        counters, queued = await pipe.execute()
+        
+        status_counts, priority_counts = {}, {}
+        for key, value in counters.items():
+            kind, _, name = key.decode().partition(":")
+            if kind == "status":
+                status_counts[name] = int(value)
+            elif kind == "priority":
+                priority_counts[int(name)] = int(value)
+        
+        return {
+            "total_tasks": int(counters.get(b"total", 0)),
+            "queued_tasks": queued,
+            "status_breakdown": status_counts,
+            "priority_breakdown": priority_counts
+        }
+
+
 class MayaScheduler:
     """Advanced scheduler for Maya control plane operations"""
     
-    def __init__(self, redis_url: str = "redis://localhost:6379/0"):
+    def __init__(self, redis_url: str = "redis://localhost:6379/0", distributed: bool = False):
         self.redis_url = redis_url
-        self.celery_app = self._create_celery_app()
-        self.tasks: Dict[str, ScheduledTask] = {}
+        self.distributed = distributed
+        # Redis lets several workers share one schedule; otherwise a local heap avoids the round trips
+        self.store = RedisTaskStore(redis_url) if distributed else InMemoryTaskStore()
         self.running_tasks: Dict[str, asyncio.Task] = {}
+        self._celery_app = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._ticker: Optional[asyncio.Task] = None
         
-        logger.info("Maya Scheduler initialized", redis_url=redis_url)
+        logger.info("Maya Scheduler initialized", redis_url=redis_url, distributed=distributed)
     
-    def _create_celery_app(self) -> Celery:
+    @property
+    def celery_app(self):
+        """Celery app for the periodic beat jobs, built on first use"""
+        if self._celery_app is None:
+            self._celery_app = self._create_celery_app()
+        return self._celery_app
+    
+    def _create_celery_app(self):
         """Create and configure Celery application"""
+        from celery import Celery
+        from celery.schedules import crontab
+        
         app = Celery('maya-scheduler')
         
         app.conf.update(
             broker_url=self.redis_url,
             result_backend=self.redis_url,
-            task_serializer='json',
-            accept_content=['json'],
-            result_serializer='json',
+            # msgpack + zstd (kombu's built-in codecs, zstd level 3) are cheaper
+            # per task than JSON + gzip; task args must stay msgpack-native
+            task_serializer='msgpack',
+            accept_content=['msgpack'],
+            result_serializer='msgpack',
+            result_accept_content=['msgpack'],
             timezone='UTC',
             enable_utc=True,
             task_track_started=True,
@@ -87,8 +292,8 @@ class MayaScheduler:
             worker_prefetch_multiplier=1,
             task_acks_late=True,
             worker_disable_rate_limits=False,
-            task_compression='gzip',
-            result_compression='gzip',
+            task_compression='zstd',
+            result_compression='zstd',
         )
         
         # Configure periodic tasks
@@ -109,24 +314,18 @@ class MayaScheduler:
         
         return app
     
-    def schedule_task(self, task: ScheduledTask) -> str:
+    async def schedule_task(self, task: ScheduledTask) -> str:
         """Schedule a new task"""
-        self.tasks[task.id] = task
-        
         # Calculate delay until scheduled time
         delay = (task.scheduled_time - datetime.utcnow()).total_seconds()
         
+        # Due tasks are picked up by run_due_tasks; anything already due runs right away
+        await self.store.add(task)
         if delay <= 0:
-            # Execute immediately
-            self._execute_task_async(task)
-        else:
-            # Schedule for later execution
-            self.celery_app.send_task(
-                'maya.scheduler.execute_scheduled_task',
-                args=[task.id],
-                countdown=delay,
-                priority=task.priority.value
-            )
+            await self._dispatch_due()
+        elif self._wakeup is not None:
+            # The ticker may be sleeping past this task's deadline
+            self._wakeup.set()
         
         logger.info("Task scheduled", 
                    task_id=task.id, 
@@ -136,6 +335,84 @@ class MayaScheduler:
         
         return task.id
     
+    async def get_task(self, task_id: str) -> Optional[ScheduledTask]:
+        """Look up a task by id"""
+        return await self.store.get(task_id)
+    
+    @property
+    def running(self) -> bool:
+        """Whether the background ticker is dispatching due tasks"""
+        return self._ticker is not None and not self._ticker.done()
+    
+    async def start(self, poll_interval: float = 1.0):
+        """Start dispatching tasks as they come due in a background task"""
+        if self.running:
+            return
+        self._ticker = asyncio.create_task(self.run_due_tasks(poll_interval))
+        logger.info("Scheduler started", distributed=self.distributed)
+    
+    async def stop(self):
+        """Stop dispatching and wait for tasks already executing"""
+        if self._ticker is not None:
+            self._ticker.cancel()
+            try:
+                await self._ticker
+            except asyncio.CancelledError:
+                pass
+            self._ticker = None
+        
+        if self.running_tasks:
+            await asyncio.gather(*self.running_tasks.values(), return_exceptions=True)
+    
+    async def run_due_tasks(self, poll_interval: float = 1.0, batch_size: int = 100):
+        """Dispatch tasks as they come due"""
+        if not self.distributed:
+            await self._run_local_ticker()
+            return
+        
+        while True:
+            try:
+                due = await self.store.pop_due(time.time(), batch_size)
+            except Exception as e:
+                # Keep the ticker alive through a Redis outage; retry on the next poll
+                logger.error("Failed to claim due tasks", error=str(e))
+                due = []
+            for task in due:
+                self._execute_task_async(task)
+            
+            # A full batch means more are probably waiting
+            if len(due) < batch_size:
+                await asyncio.sleep(poll_interval)
+    
+    async def _run_local_ticker(self):
+        """Sleep until the next heap deadline (or a new task) instead of polling"""
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                await self._dispatch_due()
+                
+                next_due = self.store.next_due()
+                timeout = None if next_due is None else max(next_due - time.time(), 0)
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wakeup = None
+    
+    async def _dispatch_due(self):
+        """Claim and start whatever is due now"""
+        for task in await self.store.pop_due(time.time()):
+            self._execute_task_async(task)
+    
+    async def _set_status(self, task: ScheduledTask, status: TaskStatus, requeue: bool = False):
+        """Apply a status transition and persist it with its counters"""
+        previous_status = task.status
+        task.status = status
+        task.updated_at = datetime.utcnow()
+        await self.store.update(task, previous_status, requeue=requeue)
+    
     def _execute_task_async(self, task: ScheduledTask):
         """Execute task asynchronously"""
         async_task = asyncio.create_task(self._execute_task(task))
@@ -143,8 +420,7 @@ class MayaScheduler:
     
     async def _execute_task(self, task: ScheduledTask):
         """Execute a scheduled task"""
-        task.status = TaskStatus.RUNNING
-        task.updated_at = datetime.utcnow()
+        await self._set_status(task, TaskStatus.RUNNING)
         
         try:
             logger.info("Executing task", 
@@ -162,40 +438,32 @@ class MayaScheduler:
             else:
                 logger.warning("Unknown task function", function=task.function)
             
-            task.status = TaskStatus.COMPLETED
+            await self._set_status(task, TaskStatus.COMPLETED)
             logger.info("Task completed successfully", task_id=task.id)
             
         except Exception as e:
             task.retry_count += 1
             
             if task.retry_count <= task.max_retries:
-                task.status = TaskStatus.PENDING
                 # Schedule retry with exponential backoff
                 retry_delay = 2 ** task.retry_count * 60  # 2, 4, 8 minutes
                 retry_time = datetime.utcnow() + timedelta(seconds=retry_delay)
                 task.scheduled_time = retry_time
+                await self._set_status(task, TaskStatus.PENDING, requeue=True)
                 
                 logger.warning("Task failed, scheduling retry",
                              task_id=task.id,
                              retry_count=task.retry_count,
                              retry_time=retry_time.isoformat(),
                              error=str(e))
-                
-                # Reschedule
-                self.celery_app.send_task(
-                    'maya.scheduler.execute_scheduled_task',
-                    args=[task.id],
-                    countdown=retry_delay
-                )
             else:
-                task.status = TaskStatus.FAILED
+                await self._set_status(task, TaskStatus.FAILED)
                 logger.error("Task failed permanently",
                            task_id=task.id,
                            retry_count=task.retry_count,
                            error=str(e))
         
         finally:
-            task.updated_at = datetime.utcnow()
             if task.id in self.running_tasks:
                 del self.running_tasks[task.id]
     
@@ -207,39 +475,36 @@ class MayaScheduler:
                    platform=platform)
         
         # Placeholder for actual implementation
-        await asyncio.sleep(1)  # Simulate work
+        if SIMULATE:
+            await asyncio.sleep(0.001)  # Simulate work
     
     async def _publish_post(self, post_data: Dict[str, Any]):
         """Publish a single post"""
         logger.info("Publishing post", post_id=post_data.get('id'))
         
         # Placeholder for actual implementation
-        await asyncio.sleep(1)  # Simulate work
+        if SIMULATE:
+            await asyncio.sleep(0.001)  # Simulate work
     
     async def _sync_metrics(self, platform: str):
         """Sync metrics from platform"""
         logger.info("Syncing metrics", platform=platform)
         
         # Placeholder for actual implementation
-        await asyncio.sleep(1)  # Simulate work
+        if SIMULATE:
+            await asyncio.sleep(0.001)  # Simulate work
     
-    def get_scheduler_stats(self) -> Dict[str, Any]:
+    async def get_scheduler_stats(self) -> Dict[str, Any]:
         """Get scheduler statistics"""
-        status_counts = {}
-        priority_counts = {}
-        
-        for task in self.tasks.values():
-            status_counts[task.status.value] = status_counts.get(task.status.value, 0) + 1
-            priority_counts[task.priority.value] = priority_counts.get(task.priority.value, 0) + 1
-        
         return {
-            "total_tasks": len(self.tasks),
+            **await self.store.stats(),
             "running_tasks": len(self.running_tasks),
-            "status_breakdown": status_counts,
-            "priority_breakdown": priority_counts,
             "scheduler_uptime": datetime.utcnow().isoformat()
         }
 
 
-# Global scheduler instance
-scheduler = MayaScheduler()
\ No newline at end of file
+# Global scheduler instance; set MAYA_DISTRIBUTED_SCHEDULER=1 to share the schedule through Redis
+scheduler = MayaScheduler(
+    redis_url=os.getenv('REDIS_URL', "redis://localhost:6379/0"),
+    distributed=os.getenv('MAYA_DISTRIBUTED_SCHEDULER', '').lower() in ('1', 'true', 'yes')
+)
\ No newline at end of file
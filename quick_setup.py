@@ -8,23 +8,26 @@ Handles installation, configuration, and validation.
 
 import asyncio
 import argparse
+import functools
+import importlib.util
 import logging
+import platform
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, NamedTuple, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from setup.audio_setup import create_audio_setup, quick_install_audio_system, validate_audio_configuration
-from helpers.maya_audio_bridge import create_maya_audio_bridge, validate_maya_audio_system
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+from setup.audio_setup import (
+    create_audio_setup,
+    invalidate_device_cache,
+    quick_install_audio_system,
+    validate_audio_configuration,
 )
+
 logger = logging.getLogger("quick_setup")
 
 BANNER = """
@@ -34,16 +37,96 @@ BANNER = """
 ╚═══════════════════════════════════════════════════════════════╝
 """
 
+# The capture test stops once this many chunks arrive, or after the timeout
+AUDIO_TEST_TARGET_CHUNKS = 20
+AUDIO_TEST_TIMEOUT = 5.0
+
+
+@dataclass
+class QuickSetupResult:
+    """Outcome of one quick setup mode; ok decides the exit code"""
+    ok: bool
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+class PlatformInfo(NamedTuple):
+    """Audio setup recommendations for one platform"""
+    platform: str
+    recommended_device: str
+    install_method: str
+    install_command: Optional[str] = None
+    download_url: Optional[str] = None
+
+
+# Setup recommendations keyed by platform.system().lower()
+_PLATFORM_TABLE = {
+    "darwin": PlatformInfo(
+        platform='macOS',
+        recommended_device='BlackHole 2ch',
+        install_method='Homebrew',
+        install_command='brew install --cask blackhole-2ch'
+    ),
+    "windows": PlatformInfo(
+        platform='Windows',
+        recommended_device='VB-Cable',
+        install_method='Manual download',
+        download_url='https://vb-audio.com/Cable/'
+    ),
+    "linux": PlatformInfo(
+        platform='Linux',
+        recommended_device='PulseAudio Virtual Sink',
+        install_method='PulseAudio module',
+        install_command='pactl load-module module-null-sink'
+    ),
+}
+
+# The OS can't change while the process runs, so resolve the recommendations once
+_CURRENT_PLATFORM_INFO = _PLATFORM_TABLE.get(platform.system().lower()) or PlatformInfo(
+    platform=platform.system().lower(),
+    recommended_device='Unknown',
+    install_method='Manual setup required'
+)
+
+
+def _write_lines(lines, flush: bool = False):
+    """Print a block of lines with one write instead of one print per line"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        if flush:
+            sys.stdout.flush()
+
 
 class QuickSetup:
     """Quick setup orchestrator for Maya audio system"""
     
     def __init__(self):
         self.audio_setup = create_audio_setup()
+        # helpers.maya_audio_bridge pulls in sounddevice/numpy/pyttsx3 at import time
+        self._bridge_loader: Optional[asyncio.Task] = None
+    
+    def preload_audio_bridge(self):
+        """Start importing the audio bridge module in a worker thread"""
+        if self._bridge_loader is None:
+            self._bridge_loader = asyncio.create_task(
+                asyncio.to_thread(importlib.import_module, "helpers.maya_audio_bridge")
+            )
+    
+    async def close(self):
+        """Cancel background warm-up work that is still running"""
+        pending = [task for task in (self._bridge_loader,)
+                   if task is not None and not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
     
-    async def run_full_setup(self) -> Dict[str, Any]:
+    async def _audio_bridge_module(self):
+        """The audio bridge module, once its background import finishes"""
+        self.preload_audio_bridge()
+        return await self._bridge_loader
+    
+    async def run_full_setup(self) -> QuickSetupResult:
         """Run complete audio system setup"""
-        print(BANNER)
+        print(BANNER, flush=True)
         print("🚀 Starting Maya Control Plane audio system setup...\n")
         
         results = {
@@ -51,33 +134,29 @@ class QuickSetup:
             'success': True,
             'errors': []
         }
+        # (step, success, data) per step; expanded into results['steps'] at the end
+        steps = []
         
-        # Step 1: Platform detection
-        print("📍 Step 1: Detecting platform and requirements...")
-        platform_info = await self._detect_platform()
-        results['steps'].append({
-            'step': 'platform_detection',
-            'success': True,
-            'data': platform_info
-        })
-        print(f"   Platform: {platform_info['platform']}")
-        print(f"   Recommended device: {platform_info['recommended_device']}")
+        # Step 1: Platform detection (the dependency check has no ordering
+        # constraint, so it runs here and is reported in Step 5)
+        print("📍 Step 1: Detecting platform and requirements...", flush=True)
+        # The dependency scan touches the filesystem on first call, so keep it off the loop
+        platform_info = self._detect_platform()
+        deps_result = await asyncio.to_thread(self._check_dependencies)
+        steps.append(('platform_detection', True, platform_info._asdict()))
+        print(f"   Platform: {platform_info.platform}")
+        print(f"   Recommended device: {platform_info.recommended_device}")
         
         # Step 2: Install audio system
-        print("\n🔧 Step 2: Installing audio system...")
+        print("\n🔧 Step 2: Installing audio system...", flush=True)
         install_result = await quick_install_audio_system()
-        results['steps'].append({
-            'step': 'audio_installation',
-            'success': install_result.get('success', False),
-            'data': install_result
-        })
+        steps.append(('audio_installation', install_result.get('success', False), install_result))
         
         if install_result.get('success'):
             print("   ✅ Audio system installed successfully")
             if 'next_steps' in install_result:
                 print("   📋 Next steps:")
-                for step in install_result['next_steps']:
-                    print(f"      • {step}")
+                _write_lines([f"      • {step}" for step in install_result['next_steps']])
         else:
             print(f"   ❌ Audio installation failed: {install_result.get('error', 'Unknown error')}")
             results['success'] = False
@@ -85,17 +164,13 @@ class QuickSetup:
             
             if 'instructions' in install_result:
                 print("   📋 Manual installation required:")
-                for instruction in install_result['instructions']:
-                    print(f"      • {instruction}")
+                _write_lines([f"      • {instruction}" for instruction in install_result['instructions']])
         
-        # Step 3: Validate configuration
-        print("\n🔍 Step 3: Validating audio configuration...")
-        validation_result = await validate_audio_configuration()
-        results['steps'].append({
-            'step': 'audio_validation',
-            'success': validation_result.get('success', False),
-            'data': validation_result
-        })
+        # Step 3: Validate configuration. Step 4's bridge test depends on the
+        # install but not on this, so both run together and report in order.
+        print("\n🔍 Step 3: Validating audio configuration...", flush=True)
+        validation_result, maya_test_result = await self._run_validations()
+        steps.append(('audio_validation', validation_result.get('success', False), validation_result))
         
         if validation_result.get('success'):
             if validation_result.get('device_found'):
@@ -119,12 +194,7 @@ class QuickSetup:
         
         # Step 4: Test Maya audio bridge
         print("\n🎭 Step 4: Testing Maya audio bridge...")
-        maya_test_result = await validate_maya_audio_system()
-        results['steps'].append({
-            'step': 'maya_bridge_test',
-            'success': maya_test_result.get('success', False),
-            'data': maya_test_result
-        })
+        steps.append(('maya_bridge_test', maya_test_result.get('success', False), maya_test_result))
         
         if maya_test_result.get('success'):
             print("   ✅ Maya audio bridge validated successfully")
@@ -132,47 +202,47 @@ class QuickSetup:
             print(f"   ❌ Maya bridge test failed: {maya_test_result.get('error', 'Unknown error')}")
             # Don't fail overall setup for Maya bridge issues
         
-        # Step 5: Dependencies check
-        print("\n📦 Step 5: Checking Python dependencies...")
-        deps_result = await self._check_dependencies()
-        results['steps'].append({
-            'step': 'dependencies_check',
-            'success': deps_result.get('success', False),
-            'data': deps_result
-        })
+        # Step 5: Dependencies check (already finished in Step 1, so report it in one write)
+        steps.append(('dependencies_check', deps_result.get('success', False), deps_result))
         
+        lines = ["\n📦 Step 5: Checking Python dependencies..."]
         if deps_result.get('success'):
-            print("   ✅ All dependencies satisfied")
+            lines.append("   ✅ All dependencies satisfied")
         else:
-            print("   ⚠️  Some dependencies missing:")
-            for missing in deps_result.get('missing', []):
-                print(f"      • {missing}")
-            print("   💡 Run: pip install -r requirements.txt")
+            lines.append("   ⚠️  Some dependencies missing:")
+            lines += [f"      • {missing}" for missing in deps_result.get('missing', [])]
+            lines.append("   💡 Run: pip install -r requirements.txt")
+        _write_lines(lines)
+        
+        results['steps'] = [{'step': step, 'success': ok, 'data': data} for step, ok, data in steps]
         
-        # Summary
-        print("\n" + "="*60)
+        # Summary, written in one go
+        lines = ["\n" + "="*60]
         if results['success']:
-            print("🎉 Setup completed successfully!")
-            print("\n📋 Next steps:")
-            print("   1. Configure multi-output device (see platform instructions above)")
-            print("   2. Test audio routing with: python quick_setup.py --test")
-            print("   3. Start Maya Control Plane with audio support")
+            lines += [
+                "🎉 Setup completed successfully!",
+                "\n📋 Next steps:",
+                "   1. Configure multi-output device (see platform instructions above)",
+                "   2. Test audio routing with: python quick_setup.py --test",
+                "   3. Start Maya Control Plane with audio support",
+            ]
         else:
-            print("❌ Setup completed with errors:")
-            for error in results['errors']:
-                print(f"   • {error}")
-            print("\n💡 Check the instructions above and try again")
+            lines.append("❌ Setup completed with errors:")
+            lines += [f"   • {error}" for error in results['errors']]
+            lines.append("\n💡 Check the instructions above and try again")
+        _write_lines(lines, flush=True)
         
-        return results
+        return QuickSetupResult(ok=results['success'], details=results)
     
-    async def run_validation_only(self) -> Dict[str, Any]:
+    async def run_validation_only(self) -> QuickSetupResult:
         """Run validation checks only"""
-        print(BANNER)
+        print(BANNER, flush=True)
         print("🔍 Running Maya audio system validation...\n")
         
         # Audio configuration validation
-        print("🔧 Validating audio configuration...")
-        validation_result = await validate_audio_configuration()
+        print("🔧 Validating audio configuration...", flush=True)
+        # Validation-only runs can afford a 50 ms sample to confirm audio is arriving
+        validation_result, maya_result = await self._run_validations(probe_amplitude=True)
         
         if validation_result.get('success'):
             print("✅ Audio system validation passed")
@@ -180,45 +250,76 @@ class QuickSetup:
             print(f"   Device: {device_info.get('name', 'Unknown')}")
             print(f"   Sample rate: {device_info.get('default_samplerate', 'Unknown')} Hz")
             print(f"   Channels: {device_info.get('max_input_channels', 'Unknown')}")
+            audio_detected = validation_result.get('audio_test', {}).get('audio_detected')
+            if audio_detected is not None:
+                print(f"   Audio detected: {'yes' if audio_detected else 'no (silent input)'}")
         else:
             print(f"❌ Audio validation failed: {validation_result.get('error', 'Unknown')}")
             if 'available_devices' in validation_result:
-                print("\n📋 Available audio devices:")
-                for device in validation_result['available_devices'][:5]:  # Show first 5
-                    print(f"   • {device.get('name', 'Unknown')} (channels: {device.get('max_input_channels', 0)})")
+                _write_lines(["\n📋 Available audio devices:"] + [  # Show first 5
+                    f"   • {device.get('name', 'Unknown')} (channels: {device.get('max_input_channels', 0)})"
+                    for device in validation_result['available_devices'][:5]
+                ])
         
         # Maya bridge validation
         print("\n🎭 Validating Maya audio bridge...")
-        maya_result = await validate_maya_audio_system()
         
         if maya_result.get('success'):
             print("✅ Maya audio bridge validation passed")
         else:
             print(f"❌ Maya bridge validation failed: {maya_result.get('error', 'Unknown')}")
         
-        return {
+        overall_success = validation_result.get('success', False) and maya_result.get('success', False)
+        return QuickSetupResult(ok=overall_success, details={
             'audio_validation': validation_result,
             'maya_validation': maya_result,
-            'overall_success': validation_result.get('success', False) and maya_result.get('success', False)
-        }
+            'overall_success': overall_success
+        })
+    
+    async def _run_validations(self, probe_amplitude: bool = False):
+        """
+        Run the audio and Maya bridge validations concurrently
+        
+        If this coroutine is cancelled (Ctrl-C), both validations are cancelled
+        with it. A validation that raises becomes a failed result and does not
+        cancel the other one, so both steps are still reported. probe_amplitude
+        is passed through to the audio device test.
+        """
+        audio_bridge = await self._audio_bridge_module()
+        tasks = [
+            asyncio.create_task(validate_audio_configuration(probe_amplitude)),
+            asyncio.create_task(audio_bridge.validate_maya_audio_system()),
+        ]
+        try:
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return tuple(
+            {'success': False, 'error': str(outcome)} if isinstance(outcome, Exception) else outcome
+            for outcome in outcomes
+        )
     
-    async def run_audio_test(self) -> Dict[str, Any]:
+    async def run_audio_test(self) -> QuickSetupResult:
         """Run audio capture test"""
-        print(BANNER)
+        print(BANNER, flush=True)
         print("🎤 Running audio capture test...\n")
         
         try:
             # Create audio bridge in non-stub mode for testing
             config = {'use_stub': False}
-            bridge = create_maya_audio_bridge(config)
+            audio_bridge = await self._audio_bridge_module()
+            bridge = audio_bridge.create_maya_audio_bridge(config)
             
             # Connect to audio system
-            print("🔌 Connecting to audio system...")
+            print("🔌 Connecting to audio system...", flush=True)
             connected = await bridge.connect_to_maya()
             
             if not connected:
                 print("❌ Failed to connect to audio system")
-                return {'success': False, 'error': 'Connection failed'}
+                return QuickSetupResult(ok=False, details={'error': 'Connection failed'})
             
             print("✅ Connected to audio system")
             
@@ -230,71 +331,77 @@ class QuickSetup:
             print(f"   Channels: {status.get('channels', 'Unknown')}")
             
             # Start brief recording test
-            print("\n🎤 Starting 5-second audio test...")
-            print("   Please make some noise or speak to test audio capture...")
+            print(f"\n🎤 Starting audio test (up to {AUDIO_TEST_TIMEOUT:.0f} seconds)...")
+            print("   Please make some noise or speak to test audio capture...", flush=True)
+            
+            # One contiguous buffer rather than a list of small bytes objects
+            captured = bytearray()
+            chunk_count = 0
+            loop = asyncio.get_running_loop()
+            enough_audio = asyncio.Event()
+            chunks: asyncio.Queue = asyncio.Queue(maxsize=128)
+            
+            def enqueue_chunk(response_data):
+                # Runs on the loop; if the consumer falls behind, drop the oldest chunk
+                if chunks.full():
+                    chunks.get_nowait()
+                chunks.put_nowait(response_data)
             
-            responses = []
             def capture_response(response_data):
-                responses.append(response_data)
-                print(f"   📥 Audio chunk captured: {len(response_data.get('audio_data', b''))} bytes")
+                # Called from the audio thread: hand off and return immediately
+                loop.call_soon_threadsafe(enqueue_chunk, response_data)
+            
+            def report_chunk(response_data):
+                nonlocal chunk_count
+                audio_data = response_data.get('audio_data', b'')
+                captured.extend(audio_data)
+                chunk_count += 1
+                print(f"   📥 Audio chunk captured: {len(audio_data)} bytes")
+                if chunk_count == AUDIO_TEST_TARGET_CHUNKS:
+                    enough_audio.set()
             
-            # Start recording
+            async def consume_chunks():
+                while True:
+                    report_chunk(await chunks.get())
+            
+            # Record until enough chunks arrive, or give up after the timeout
+            consumer = asyncio.create_task(consume_chunks())
             await bridge.start_conversation_loop(capture_response)
-            await asyncio.sleep(5)  # Record for 5 seconds
+            try:
+                await asyncio.wait_for(enough_audio.wait(), timeout=AUDIO_TEST_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
             await bridge.stop_conversation_loop()
             
+            consumer.cancel()
+            while not chunks.empty():
+                report_chunk(chunks.get_nowait())
+            
             print(f"\n✅ Audio test completed")
-            print(f"   Captured {len(responses)} audio chunks")
+            print(f"   Captured {chunk_count} audio chunks ({len(captured)} bytes)")
             
             await bridge.disconnect()
             
-            return {
-                'success': True,
-                'chunks_captured': len(responses),
+            return QuickSetupResult(ok=True, details={
+                'chunks_captured': chunk_count,
+                'bytes_captured': len(captured),
                 'audio_status': status
-            }
+            })
             
         except Exception as e:
             logger.error(f"Audio test failed: {e}")
             print(f"❌ Audio test failed: {e}")
-            return {'success': False, 'error': str(e)}
+            return QuickSetupResult(ok=False, details={'error': str(e)})
     
-    async def _detect_platform(self) -> Dict[str, Any]:
+    @staticmethod
+    def _detect_platform() -> PlatformInfo:
         """Detect platform and get setup recommendations"""
-        import platform
-        
-        system = platform.system().lower()
-        
-        if system == "darwin":  # macOS
-            return {
-                'platform': 'macOS',
-                'recommended_device': 'BlackHole 2ch',
-                'install_method': 'Homebrew',
-                'install_command': 'brew install --cask blackhole-2ch'
-            }
-        elif system == "windows":
-            return {
-                'platform': 'Windows',
-                'recommended_device': 'VB-Cable',
-                'install_method': 'Manual download',
-                'download_url': 'https://vb-audio.com/Cable/'
-            }
-        elif system == "linux":
-            return {
-                'platform': 'Linux',
-                'recommended_device': 'PulseAudio Virtual Sink',
-                'install_method': 'PulseAudio module',
-                'install_command': 'pactl load-module module-null-sink'
-            }
-        else:
-            return {
-                'platform': system,
-                'recommended_device': 'Unknown',
-                'install_method': 'Manual setup required'
-            }
+        return _CURRENT_PLATFORM_INFO
     
-    async def _check_dependencies(self) -> Dict[str, Any]:
-        """Check Python dependencies"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _check_dependencies() -> Dict[str, Any]:
+        """Check Python dependencies are installed, without importing them"""
         required_deps = [
             'sounddevice',
             'numpy',
@@ -304,11 +411,12 @@ class QuickSetup:
         missing = []
         available = []
         
+        # find_spec only consults the import finders; importing sounddevice would
+        # initialize PortAudio and enumerate devices just to answer "installed?"
         for dep in required_deps:
-            try:
-                __import__(dep)
+            if importlib.util.find_spec(dep) is not None:
                 available.append(dep)
-            except ImportError:
+            else:
                 missing.append(dep)
         
         return {
@@ -318,7 +426,6 @@ class QuickSetup:
             'total_required': len(required_deps)
         }
 
-
 async def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -344,10 +451,22 @@ Examples:
     
     args = parser.parse_args()
     
+    # Only the CLI configures the root logger; importing this module leaves logging alone
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    if args.test:
+        # The capture test wants the devices as they are now, not a cached listing;
+        # dropping it first makes create_audio_setup() pre-warm a fresh one
+        invalidate_device_cache()
     setup = QuickSetup()
+    if not args.install:
+        # Overlap the heavy audio imports with the banner and early steps
+        setup.preload_audio_bridge()
     
     try:
         if args.validate:
@@ -355,17 +474,13 @@ Examples:
         elif args.test:
             result = await setup.run_audio_test()
         elif args.install:
-            result = await quick_install_audio_system()
-            print(f"Installation result: {result}")
+            install_result = await quick_install_audio_system()
+            print(f"Installation result: {install_result}")
+            result = QuickSetupResult(ok=install_result.get('success', False), details=install_result)
         else:
             result = await setup.run_full_setup()
         
-        # Exit with appropriate code
-        if isinstance(result, dict):
-            if result.get('success') or result.get('overall_success'):
-                sys.exit(0)
-            else:
-                sys.exit(1)
+        sys.exit(0 if result.ok else 1)
         
     except KeyboardInterrupt:
         print("\n\n🛑 Setup cancelled by user")
@@ -374,6 +489,8 @@ Examples:
         logger.error(f"Setup failed: {e}")
         print(f"\n❌ Setup failed: {e}")
         sys.exit(1)
+    finally:
+        await setup.close()
 
 
 if __name__ == "__main__":
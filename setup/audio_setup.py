@@ -5,12 +5,16 @@ Automated BlackHole installation and configuration system for professional
 system audio capture. Supports macOS BlackHole and Windows VB-Cable.
 """
 
+import asyncio
 import os
 import sys
 import platform
-import subprocess
+import shutil
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+import re
+import time
+from collections import deque
+from typing import Dict, Any, List, NamedTuple, Optional, Pattern, Tuple
 from pathlib import Path
 import tempfile
 import urllib.request
@@ -18,6 +22,271 @@ import json
 
 logger = logging.getLogger("audio_setup")
 
+# The OS is fixed for the process; resolve it once rather than in every AudioSetup()
+_PLATFORM = platform.system().lower()
+
+
+class AudioDevice(NamedTuple):
+    """One capture-capable audio device as listed by PortAudio"""
+    index: int
+    name: str
+    max_input_channels: int
+    max_output_channels: int
+    default_samplerate: float
+    name_lower: str
+
+
+# PortAudio enumeration is slow (hundreds of ms cold), so successful results are
+# reused for DEVICE_CACHE_TTL seconds: (time.monotonic() when listed, devices)
+DEVICE_CACHE_TTL = 30.0
+_device_cache: Optional[Tuple[float, List[AudioDevice]]] = None
+# The enumeration in flight, shared so concurrent listings (and the pre-warm) run it once
+_device_refresh: Optional[asyncio.Task] = None
+
+
+def invalidate_device_cache():
+    """Force the next device listing to re-enumerate (e.g. after installing a device)"""
+    global _device_cache, _device_refresh
+    _device_cache = None
+    # An enumeration already in flight may predate the change, so don't join it
+    _device_refresh = None
+
+
+def _device_cache_fresh() -> bool:
+    return _device_cache is not None and time.monotonic() - _device_cache[0] < DEVICE_CACHE_TTL
+
+
+async def _refresh_device_cache() -> List[AudioDevice]:
+    global _device_cache
+    devices = await asyncio.to_thread(_query_devices)
+    # Only the current refresh may fill the cache; an invalidated one is stale
+    if asyncio.current_task() is _device_refresh:
+        _device_cache = (time.monotonic(), devices)
+    return devices
+
+
+def _start_device_refresh() -> asyncio.Task:
+    """Start an enumeration on the running loop, or return the one in flight"""
+    global _device_refresh
+    loop = asyncio.get_running_loop()
+    if _device_refresh is None or _device_refresh.done() or _device_refresh.get_loop() is not loop:
+        _device_refresh = loop.create_task(_refresh_device_cache())
+        # A pre-warm may finish with nobody awaiting it; errors are reported by the next listing
+        _device_refresh.add_done_callback(lambda task: task.cancelled() or task.exception())
+    return _device_refresh
+
+
+# sounddevice initializes PortAudio on import, so it (and numpy) load on first use
+_sd: Any = None
+_np: Any = None
+
+
+def _audio_libs() -> Tuple[Any, Any]:
+    """(sounddevice, numpy), imported once on first use; raises ImportError if missing"""
+    global _sd, _np
+    if _sd is None:
+        import sounddevice
+        import numpy
+        _sd, _np = sounddevice, numpy
+    return _sd, _np
+
+
+def _query_devices() -> List[AudioDevice]:
+    """Enumerate capture-capable audio devices via PortAudio (blocking)"""
+    sd, _ = _audio_libs()
+    return [
+        AudioDevice(
+            index=i,
+            name=info['name'],
+            max_input_channels=info['max_input_channels'],
+            max_output_channels=info['max_output_channels'],
+            default_samplerate=info['default_samplerate'],
+            name_lower=info['name'].lower()
+        )
+        for i, info in enumerate(sd.query_devices())
+        # Only inputs can be the capture device; output-only entries (e.g. Windows'
+        # "CABLE Input" playback side) would otherwise match and fail the test
+        if info['max_input_channels'] > 0
+    ]
+
+
+# Device recommendation per platform.system().lower()
+_DEVICE_RECOMMENDATIONS: Dict[str, Dict[str, str]] = {
+    'darwin': {
+        'platform': 'macOS',
+        'recommended_device': 'BlackHole 2ch',
+        'install_command': 'brew install --cask blackhole-2ch',
+        'note': 'Professional virtual audio driver for macOS'
+    },
+    'windows': {
+        'platform': 'Windows',
+        'recommended_device': 'VB-Cable',
+        'download_url': 'https://vb-audio.com/Cable/',
+        'note': 'Free virtual audio cable for Windows'
+    },
+    'linux': {
+        'platform': 'Linux',
+        'recommended_device': 'PulseAudio Virtual Sink',
+        'setup_command': 'pactl load-module module-null-sink',
+        'note': 'Built-in PulseAudio virtual device'
+    },
+}
+
+
+# Setup instructions are constant, so each getter hands out one shared tuple
+_MACOS_SETUP_STEPS: Tuple[str, ...] = (
+    "1. Open Audio MIDI Setup (Applications > Utilities)",
+    "2. Create a Multi-Output Device:",
+    "   - Click the '+' button and select 'Create Multi-Output Device'",
+    "   - Check both 'BlackHole 2ch' and your built-in speakers",
+    "   - Right-click the Multi-Output Device and 'Use This Device For Sound Output'",
+    "3. System audio will now play through both speakers and BlackHole",
+    "4. Maya will capture audio from BlackHole device",
+    "5. Run 'python quick_setup.py --validate' to test the setup",
+)
+
+_WINDOWS_SETUP_STEPS: Tuple[str, ...] = (
+    "1. After installing VB-Cable, restart your computer",
+    "2. Right-click the sound icon in system tray > 'Open Sound settings'",
+    "3. Set up multi-output:",
+    "   - Under 'Choose your output device', keep your speakers selected",
+    "   - Install 'Audio Router' or similar software for multi-output",
+    "   - Route system audio to both speakers and CABLE Input",
+    "4. Set CABLE Output as Maya's input device",
+    "5. Run 'python quick_setup.py --validate' to test the setup",
+)
+
+_LINUX_SETUP_STEPS: Tuple[str, ...] = (
+    "1. Virtual sink 'maya_virtual_sink' has been created",
+    "2. Set up audio routing:",
+    "   - Install pavucontrol: sudo apt install pavucontrol",
+    "   - Open pavucontrol and go to 'Recording' tab",
+    "   - Set applications to record from 'Maya Virtual Audio Device'",
+    "3. Route system audio to both speakers and virtual sink",
+    "4. Run 'python quick_setup.py --validate' to test the setup",
+)
+
+_MANUAL_BLACKHOLE_STEPS: Tuple[str, ...] = (
+    "Manual BlackHole installation:",
+    "1. Download BlackHole from: https://existential.audio/blackhole/",
+    "2. Run the installer package",
+    "3. Restart your computer",
+    "4. Verify installation in Audio MIDI Setup",
+    "5. Run audio setup validation",
+)
+
+
+# Keep `brew install` to the one cask: no tap auto-update, cleanup pass or analytics ping
+BREW_ENV = {
+    'HOMEBREW_NO_AUTO_UPDATE': '1',
+    'HOMEBREW_NO_INSTALL_CLEANUP': '1',
+    'HOMEBREW_NO_ANALYTICS': '1',
+}
+
+
+async def _run_command(*cmd: str, env: Optional[Dict[str, str]] = None) -> Tuple[int, str, str]:
+    """Run a command without blocking the event loop; returns (returncode, stdout, stderr)"""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, **env} if env else None
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace')
+
+
+# brew reports an existing cask on stderr; there's nothing left to do once it says so
+_ALREADY_INSTALLED = re.compile(rb'already installed', re.IGNORECASE)
+
+# _stream_command reads output in chunks of this size and splits on \n or \r itself
+_STREAM_CHUNK = 64 * 1024
+_LINE_BREAK = re.compile(rb'[\r\n]')
+# How long a command gets to exit after its output ends or it is told to stop
+_EXIT_GRACE = 5.0
+
+
+async def _stream_command(*cmd: str, env: Optional[Dict[str, str]] = None,
+                          stop_on: Optional[Pattern[bytes]] = None,
+                          tail: int = 50, timeout: float = 600.0) -> Tuple[Optional[int], str, str, bool]:
+    """
+    Run a long command, logging its output line by line as it arrives
+    
+    Only the last `tail` lines of each stream are kept for the result. If a
+    line matches stop_on, or the command runs longer than timeout seconds,
+    the process is terminated early.
+    
+    Returns:
+        (returncode, stdout tail, stderr tail, whether stop_on matched)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, **env} if env else None
+    )
+    stdout_tail: deque = deque(maxlen=tail)
+    stderr_tail: deque = deque(maxlen=tail)
+    matched = False
+    halt = asyncio.Event()
+    
+    def emit(raw: bytes, lines: deque, log):
+        nonlocal matched
+        if not raw.strip():
+            return
+        text = raw.decode('utf-8', 'replace').rstrip()
+        lines.append(text)
+        log(f"{cmd[0]}: {text}")
+        if stop_on is not None and stop_on.search(raw):
+            matched = True
+            halt.set()
+    
+    async def pump(stream, lines: deque, log):
+        # Fixed-size reads rather than readline(): progress bars redraw with \r and
+        # can run past StreamReader's line limit, which would kill the reader
+        pending = b''
+        try:
+            while True:
+                chunk = await stream.read(_STREAM_CHUNK)
+                if not chunk:
+                    break
+                parts = _LINE_BREAK.split(pending + chunk)
+                pending = parts.pop()
+                if len(pending) > _STREAM_CHUNK:
+                    # No line break in sight; emit what we have rather than grow without bound
+                    parts.append(pending)
+                    pending = b''
+                for raw in parts:
+                    emit(raw, lines, log)
+            emit(pending, lines, log)
+        except Exception as e:
+            logger.error(f"{cmd[0]}: failed reading output: {e}")
+            halt.set()
+    
+    pumps = asyncio.gather(
+        pump(proc.stdout, stdout_tail, logger.info),
+        pump(proc.stderr, stderr_tail, logger.debug)
+    )
+    halted = asyncio.ensure_future(halt.wait())
+    timed_out = False
+    try:
+        done, _ = await asyncio.wait({pumps, halted}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        timed_out = not done
+    finally:
+        halted.cancel()
+        if not pumps.done():
+            # Stopping early (match, reader error, timeout or cancellation): nothing
+            # will drain the pipes any more, so the process mustn't keep writing to them
+            if proc.returncode is None:
+                proc.terminate()
+            pumps.cancel()
+        await asyncio.gather(pumps, return_exceptions=True)
+    
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=_EXIT_GRACE)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+    
+    if timed_out:
+        stderr_tail.append(f"{cmd[0]} timed out after {timeout:.0f}s")
+    return proc.returncode, "\n".join(stdout_tail), "\n".join(stderr_tail), matched
 
 class AudioSetup:
     """
@@ -32,7 +301,7 @@ class AudioSetup:
     """
     
     def __init__(self):
-        self.platform = platform.system().lower()
+        self.platform = _PLATFORM
         self.is_macos = self.platform == "darwin"
         self.is_windows = self.platform == "windows"
         self.is_linux = self.platform == "linux"
@@ -44,6 +313,21 @@ class AudioSetup:
         self.channels = 2
         self.buffer_size = 1024
         
+        # Lowercase substrings that identify the capture device on this platform,
+        # matched against each cached device's name_lower
+        self._match_needles: Tuple[str, ...] = {
+            'darwin': (self.blackhole_device_name.lower(),),
+            'windows': ('cable',),
+            'linux': ('maya_virtual',),
+        }.get(self.platform, ())
+        
+        # Platform installer, resolved once; None on unsupported platforms
+        self._install_fn = {
+            'darwin': self._install_blackhole_macos,
+            'windows': self._setup_vb_cable_windows,
+            'linux': self._setup_pulseaudio_linux,
+        }.get(self.platform)
+        
     async def install_audio_system(self) -> Dict[str, Any]:
         """
         Install and configure audio system based on platform
@@ -53,27 +337,19 @@ class AudioSetup:
         """
         logger.info(f"Installing audio system for {self.platform}")
         
-        if self.is_macos:
-            return await self._install_blackhole_macos()
-        elif self.is_windows:
-            return await self._setup_vb_cable_windows()
-        elif self.is_linux:
-            return await self._setup_pulseaudio_linux()
-        else:
+        if self._install_fn is None:
             return {
                 'success': False,
                 'error': f'Unsupported platform: {self.platform}',
                 'platform': self.platform
             }
+        return await self._install_fn()
     
     async def _install_blackhole_macos(self) -> Dict[str, Any]:
         """Install BlackHole on macOS using Homebrew"""
         try:
-            # Check if Homebrew is installed
-            brew_check = subprocess.run(['which', 'brew'], 
-                                      capture_output=True, text=True)
-            
-            if brew_check.returncode != 0:
+            # Check if Homebrew is installed (PATH scan, no subprocess)
+            if shutil.which('brew') is None:
                 return {
                     'success': False,
                     'error': 'Homebrew not found',
@@ -83,16 +359,26 @@ class AudioSetup:
                     ]
                 }
             
+            # Re-runs are the common case: `brew list` answers in milliseconds,
+            # where `brew install` would resolve the cask before saying so
+            listed, _, _ = await _run_command('brew', 'list', '--cask', 'blackhole-2ch', env=BREW_ENV)
+            if listed == 0:
+                return await self._blackhole_already_installed()
+            
             # Install BlackHole
             logger.info("Installing BlackHole via Homebrew...")
-            install_result = subprocess.run([
-                'brew', 'install', '--cask', 'blackhole-2ch'
-            ], capture_output=True, text=True)
+            returncode, stdout, stderr, already_installed = await _stream_command(
+                'brew', 'install', '--cask', 'blackhole-2ch', env=BREW_ENV, stop_on=_ALREADY_INSTALLED
+            )
+            
+            if already_installed:
+                return await self._blackhole_already_installed()
             
-            if install_result.returncode == 0:
-                # Verify installation
+            if returncode == 0:
+                # Verify installation against a fresh enumeration
+                invalidate_device_cache()
                 devices = await self._list_audio_devices()
-                blackhole_found = any(self.blackhole_device_name in device.get('name', '') 
+                blackhole_found = any(self.blackhole_device_name in device.name
                                     for device in devices)
                 
                 if blackhole_found:
@@ -106,24 +392,14 @@ class AudioSetup:
                     return {
                         'success': False,
                         'error': 'BlackHole installed but device not found',
-                        'install_output': install_result.stdout
+                        'install_output': stdout
                     }
             else:
-                # Check if already installed
-                if "already installed" in install_result.stderr.lower():
-                    return {
-                        'success': True,
-                        'device_name': self.blackhole_device_name,
-                        'platform': 'macOS',
-                        'message': 'BlackHole already installed',
-                        'next_steps': await self._get_macos_setup_instructions()
-                    }
-                else:
-                    return {
-                        'success': False,
-                        'error': 'Failed to install BlackHole',
-                        'install_error': install_result.stderr
-                    }
+                return {
+                    'success': False,
+                    'error': 'Failed to install BlackHole',
+                    'install_error': stderr
+                }
                     
         except Exception as e:
             logger.error(f"BlackHole installation failed: {e}")
@@ -133,6 +409,16 @@ class AudioSetup:
                 'manual_instructions': await self._get_manual_blackhole_instructions()
             }
     
+    async def _blackhole_already_installed(self) -> Dict[str, Any]:
+        """Install result for a BlackHole cask that was already present"""
+        return {
+            'success': True,
+            'device_name': self.blackhole_device_name,
+            'platform': 'macOS',
+            'message': 'BlackHole already installed',
+            'next_steps': await self._get_macos_setup_instructions()
+        }
+    
     async def _setup_vb_cable_windows(self) -> Dict[str, Any]:
         """Provide VB-Cable setup instructions for Windows"""
         return {
@@ -157,6 +443,27 @@ class AudioSetup:
             # Create virtual audio devices using PulseAudio
             logger.info("Setting up PulseAudio virtual devices...")
             
+            if shutil.which('pactl') is None:
+                return {
+                    'success': False,
+                    'error': 'pactl not found',
+                    'instructions': [
+                        'Install PulseAudio utilities (e.g. sudo apt install pulseaudio-utils)',
+                        'Then run this setup again'
+                    ]
+                }
+            
+            # A re-run would load a second sink; list modules first (cheap) and reuse ours
+            listed, modules, _ = await _run_command('pactl', 'list', 'short', 'modules')
+            if listed == 0 and 'sink_name=maya_virtual_sink' in modules:
+                return {
+                    'success': True,
+                    'platform': 'Linux',
+                    'device_name': 'maya_virtual_sink',
+                    'message': 'Virtual sink already loaded',
+                    'next_steps': await self._get_linux_setup_instructions()
+                }
+            
             # Load null-sink module for virtual device
             null_sink_cmd = [
                 'pactl', 'load-module', 'module-null-sink',
@@ -164,9 +471,11 @@ class AudioSetup:
                 'sink_properties=device.description="Maya Virtual Audio Device"'
             ]
             
-            result = subprocess.run(null_sink_cmd, capture_output=True, text=True)
+            returncode, _, stderr = await _run_command(*null_sink_cmd)
             
-            if result.returncode == 0:
+            if returncode == 0:
+                # The new sink changes the device list
+                invalidate_device_cache()
                 return {
                     'success': True,
                     'platform': 'Linux',
@@ -177,7 +486,7 @@ class AudioSetup:
                 return {
                     'success': False,
                     'error': 'Failed to create PulseAudio virtual device',
-                    'stderr': result.stderr
+                    'stderr': stderr
                 }
                 
         except Exception as e:
@@ -187,23 +496,14 @@ class AudioSetup:
                 'error': str(e)
             }
     
-    async def _list_audio_devices(self) -> List[Dict[str, Any]]:
-        """List available audio devices"""
+    async def _list_audio_devices(self) -> List[AudioDevice]:
+        """List available audio devices (cached for DEVICE_CACHE_TTL seconds)"""
+        if _device_cache_fresh():
+            return _device_cache[1]
+        
         try:
-            import sounddevice as sd
-            devices = sd.query_devices()
-            
-            device_list = []
-            for i, device in enumerate(devices):
-                device_list.append({
-                    'index': i,
-                    'name': device['name'],
-                    'max_input_channels': device['max_input_channels'],
-                    'max_output_channels': device['max_output_channels'],
-                    'default_samplerate': device['default_samplerate']
-                })
-            
-            return device_list
+            # Shielded: a cancelled caller shouldn't abort an enumeration others share
+            return await asyncio.shield(_start_device_refresh())
             
         except ImportError:
             logger.warning("sounddevice not available for device listing")
@@ -212,10 +512,13 @@ class AudioSetup:
             logger.error(f"Failed to list audio devices: {e}")
             return []
     
-    async def validate_audio_setup(self) -> Dict[str, Any]:
+    async def validate_audio_setup(self, probe_amplitude: bool = False) -> Dict[str, Any]:
         """
         Validate audio system configuration
         
+        Args:
+            probe_amplitude: Record a short sample to report whether audio is arriving
+            
         Returns:
             Validation result with device status and recommendations
         """
@@ -223,25 +526,17 @@ class AudioSetup:
             devices = await self._list_audio_devices()
             
             # Find target audio device
-            target_device = None
-            if self.is_macos:
-                target_device = next((d for d in devices 
-                                    if self.blackhole_device_name in d['name']), None)
-            elif self.is_windows:
-                target_device = next((d for d in devices 
-                                    if 'cable' in d['name'].lower()), None)
-            elif self.is_linux:
-                target_device = next((d for d in devices 
-                                    if 'maya_virtual' in d['name'].lower()), None)
+            target_device = next((d for d in devices
+                                  if any(n in d.name_lower for n in self._match_needles)), None)
             
             if target_device:
                 # Test audio device access
-                test_result = await self._test_audio_device(target_device)
+                test_result = await self._test_audio_device(target_device, probe_amplitude)
                 
                 return {
                     'success': True,
                     'device_found': True,
-                    'device_info': target_device,
+                    'device_info': target_device._asdict(),
                     'audio_test': test_result,
                     'ready_for_maya': test_result.get('success', False)
                 }
@@ -249,7 +544,7 @@ class AudioSetup:
                 return {
                     'success': False,
                     'device_found': False,
-                    'available_devices': devices,
+                    'available_devices': [d._asdict() for d in devices],
                     'recommendation': await self._get_device_recommendation()
                 }
                 
@@ -260,38 +555,37 @@ class AudioSetup:
                 'error': str(e)
             }
     
-    async def _test_audio_device(self, device: Dict[str, Any]) -> Dict[str, Any]:
-        """Test audio device functionality"""
+    async def _test_audio_device(self, device: AudioDevice,
+                                 probe_amplitude: bool = False) -> Dict[str, Any]:
+        """
+        Test audio device functionality
+        
+        By default this only asks PortAudio whether the device accepts our
+        capture settings, which returns immediately. With probe_amplitude a
+        short sample is recorded to check that audio is actually arriving.
+        """
         try:
-            import sounddevice as sd
-            import numpy as np
-            
-            device_index = device['index']
+            device_index = device.index
+            channels = min(self.channels, device.max_input_channels)
             
             # Test recording capability
-            logger.info(f"Testing audio device: {device['name']}")
-            
-            # Record a short test sample
-            duration = 1.0  # seconds
-            test_recording = sd.rec(
-                int(duration * self.sample_rate),
-                samplerate=self.sample_rate,
-                channels=min(self.channels, device['max_input_channels']),
-                device=device_index,
-                dtype='float64'
-            )
-            sd.wait()  # Wait for recording to complete
+            logger.info(f"Testing audio device: {device.name}")
             
-            # Check if we got actual audio data
-            max_amplitude = np.max(np.abs(test_recording))
+            max_amplitude = None
+            if probe_amplitude:
+                # The capture blocks for its duration, so it runs in a worker thread
+                max_amplitude = await asyncio.to_thread(self._record_test_sample, device, 0.05)
+            else:
+                await asyncio.to_thread(self._check_input_settings, device)
             
             return {
                 'success': True,
                 'device_index': device_index,
                 'sample_rate': self.sample_rate,
-                'channels_tested': min(self.channels, device['max_input_channels']),
-                'max_amplitude': float(max_amplitude),
-                'audio_detected': max_amplitude > 0.001  # Basic noise threshold
+                'channels_tested': channels,
+                'max_amplitude': max_amplitude,
+                # Basic noise threshold; None when no sample was recorded
+                'audio_detected': max_amplitude > 0.001 if max_amplitude is not None else None
             }
             
         except ImportError:
@@ -306,89 +600,72 @@ class AudioSetup:
                 'error': str(e)
             }
     
-    async def _get_macos_setup_instructions(self) -> List[str]:
+    def _check_input_settings(self, device: AudioDevice):
+        """Raise if the device can't open with our capture settings (blocking)"""
+        sd, _ = _audio_libs()
+        
+        sd.check_input_settings(
+            device=device.index,
+            channels=min(self.channels, device.max_input_channels),
+            samplerate=self.sample_rate,
+            dtype='float32'
+        )
+    
+    def _record_test_sample(self, device: AudioDevice, duration: float = 1.0) -> float:
+        """Record a short sample from the device and return its peak amplitude (blocking)"""
+        sd, np = _audio_libs()
+        
+        test_recording = sd.rec(
+            int(duration * self.sample_rate),
+            samplerate=self.sample_rate,
+            channels=min(self.channels, device.max_input_channels),
+            device=device.index,
+            dtype='float32'  # PortAudio's native sample format
+        )
+        sd.wait()  # Wait for recording to complete
+        
+        # Check if we got actual audio data; abs in place avoids a second buffer
+        return float(np.abs(test_recording, out=test_recording).max())
+    
+    async def _get_macos_setup_instructions(self) -> Tuple[str, ...]:
         """Get macOS-specific setup instructions"""
-        return [
-            "1. Open Audio MIDI Setup (Applications > Utilities)",
-            "2. Create a Multi-Output Device:",
-            "   - Click the '+' button and select 'Create Multi-Output Device'",
-            "   - Check both 'BlackHole 2ch' and your built-in speakers",
-            "   - Right-click the Multi-Output Device and 'Use This Device For Sound Output'",
-            "3. System audio will now play through both speakers and BlackHole",
-            "4. Maya will capture audio from BlackHole device",
-            "5. Run 'python quick_setup.py --validate' to test the setup"
-        ]
+        return _MACOS_SETUP_STEPS
     
-    async def _get_windows_setup_instructions(self) -> List[str]:
+    async def _get_windows_setup_instructions(self) -> Tuple[str, ...]:
         """Get Windows-specific setup instructions"""
-        return [
-            "1. After installing VB-Cable, restart your computer",
-            "2. Right-click the sound icon in system tray > 'Open Sound settings'",
-            "3. Set up multi-output:",
-            "   - Under 'Choose your output device', keep your speakers selected",
-            "   - Install 'Audio Router' or similar software for multi-output",
-            "   - Route system audio to both speakers and CABLE Input",
-            "4. Set CABLE Output as Maya's input device",
-            "5. Run 'python quick_setup.py --validate' to test the setup"
-        ]
+        return _WINDOWS_SETUP_STEPS
     
-    async def _get_linux_setup_instructions(self) -> List[str]:
+    async def _get_linux_setup_instructions(self) -> Tuple[str, ...]:
         """Get Linux-specific setup instructions"""
-        return [
-            "1. Virtual sink 'maya_virtual_sink' has been created",
-            "2. Set up audio routing:",
-            "   - Install pavucontrol: sudo apt install pavucontrol",
-            "   - Open pavucontrol and go to 'Recording' tab",
-            "   - Set applications to record from 'Maya Virtual Audio Device'",
-            "3. Route system audio to both speakers and virtual sink",
-            "4. Run 'python quick_setup.py --validate' to test the setup"
-        ]
+        return _LINUX_SETUP_STEPS
     
     async def _get_device_recommendation(self) -> Dict[str, Any]:
         """Get device setup recommendation based on platform"""
-        if self.is_macos:
-            return {
-                'platform': 'macOS',
-                'recommended_device': 'BlackHole 2ch',
-                'install_command': 'brew install --cask blackhole-2ch',
-                'note': 'Professional virtual audio driver for macOS'
-            }
-        elif self.is_windows:
-            return {
-                'platform': 'Windows',
-                'recommended_device': 'VB-Cable',
-                'download_url': 'https://vb-audio.com/Cable/',
-                'note': 'Free virtual audio cable for Windows'
-            }
-        elif self.is_linux:
-            return {
-                'platform': 'Linux',
-                'recommended_device': 'PulseAudio Virtual Sink',
-                'setup_command': 'pactl load-module module-null-sink',
-                'note': 'Built-in PulseAudio virtual device'
-            }
-        else:
+        recommendation = _DEVICE_RECOMMENDATIONS.get(self.platform)
+        if recommendation is None:
             return {
                 'platform': self.platform,
                 'note': 'Platform not supported for automated setup'
             }
+        # Copy so callers can't mutate the shared table
+        return dict(recommendation)
     
-    async def _get_manual_blackhole_instructions(self) -> List[str]:
+    async def _get_manual_blackhole_instructions(self) -> Tuple[str, ...]:
         """Get manual BlackHole installation instructions"""
-        return [
-            "Manual BlackHole installation:",
-            "1. Download BlackHole from: https://existential.audio/blackhole/",
-            "2. Run the installer package",
-            "3. Restart your computer",
-            "4. Verify installation in Audio MIDI Setup",
-            "5. Run audio setup validation"
-        ]
+        return _MANUAL_BLACKHOLE_STEPS
 
 
 # Factory function
 def create_audio_setup() -> AudioSetup:
-    """Create audio setup instance"""
-    return AudioSetup()
+    """Create audio setup instance, pre-warming the device cache when called on a running loop"""
+    setup = AudioSetup()
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return setup  # No loop to overlap the enumeration with
+    if not _device_cache_fresh():
+        _start_device_refresh()
+    return setup
 
 
 # Utility functions
@@ -398,7 +675,7 @@ async def quick_install_audio_system() -> Dict[str, Any]:
     return await setup.install_audio_system()
 
 
-async def validate_audio_configuration() -> Dict[str, Any]:
+async def validate_audio_configuration(probe_amplitude: bool = False) -> Dict[str, Any]:
     """Quick audio configuration validation"""
     setup = create_audio_setup()
-    return await setup.validate_audio_setup()
\ No newline at end of file
+    return await setup.validate_audio_setup(probe_amplitude)
\ No newline at end of file
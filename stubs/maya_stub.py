@@ -50,6 +50,8 @@ class MayaAPIStub:
         # Route to appropriate stub method
         if endpoint == "analyze_intent":
             return await self._analyze_intent_stub(data or {})
+        elif endpoint == "analyze_intent_batch":
+            return await self._analyze_intent_batch_stub(data or {})
         elif endpoint == "process_intent":
             return await self._process_intent_stub(data or {})
         elif endpoint == "create_campaign":
@@ -116,6 +118,17 @@ class MayaAPIStub:
             "timestamp": datetime.utcnow().isoformat()
         }
     
+    async def _analyze_intent_batch_stub(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Stub for batched intent analysis (results in request order)"""
+        items = data.get("items", [])
+        results = [await self._analyze_intent_stub(item) for item in items]
+        
+        return {
+            "success": True,
+            "results": results,
+            "count": len(results)
+        }
+    
     async def _process_intent_stub(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Stub for intent processing"""
         intent_data = data
@@ -0,0 +1,83 @@
+"""
+Tests for AdapterClientPool
+
+Unit tests for per-platform client leasing and lazy rebuilds.
+"""
+
+import httpx
+import pytest
+
+from hub.adapter_pool import AdapterClientPool
+
+
+class FakeAdapter:
+    """Adapter stand-in with a switchable health check"""
+
+    def __init__(self):
+        self.healthy = True
+        self.closed = False
+
+    async def health_check(self):
+        return {"healthy": self.healthy}
+
+    async def create_post(self, content):
+        if content.get("fail"):
+            raise RuntimeError("platform error")
+        if content.get("disconnect"):
+            raise httpx.ConnectError("connection reset")
+        return {"success": True}
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.closed = True
+
+
+class TestAdapterClientPool:
+    """Test suite for AdapterClientPool"""
+
+    @pytest.mark.asyncio
+    async def test_failed_call_keeps_client(self):
+        """Test that a request-level error does not replace the client"""
+        pool = AdapterClientPool()
+        pool.register("tiktok", FakeAdapter)
+        first = pool.clients["tiktok"]
+
+        with pytest.raises(RuntimeError):
+            async with pool.lease("tiktok") as adapter:
+                await adapter.create_post({"fail": True})
+
+        async with pool.lease("tiktok") as adapter:
+            assert adapter is first
+
+        assert pool.get_stats()["tiktok"]["rebuilds"] == 0
+
+    @pytest.mark.asyncio
+    async def test_connection_error_rebuilds_client_on_next_lease(self):
+        """Test that a transport failure replaces and closes the client"""
+        pool = AdapterClientPool()
+        pool.register("tiktok", FakeAdapter)
+        first = pool.clients["tiktok"]
+
+        with pytest.raises(httpx.ConnectError):
+            async with pool.lease("tiktok") as adapter:
+                await adapter.create_post({"disconnect": True})
+
+        async with pool.lease("tiktok") as adapter:
+            assert await adapter.create_post({}) == {"success": True}
+
+        assert adapter is not first
+        assert first.closed and not adapter.closed
+        assert pool.get_stats()["tiktok"]["rebuilds"] == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_client_is_probed_before_reuse(self):
+        """Test that a client idle past the TTL is health-checked"""
+        pool = AdapterClientPool(ttl=0)
+        pool.register("tiktok", FakeAdapter)
+        first = pool.clients["tiktok"]
+
+        async with pool.lease("tiktok") as adapter:
+            assert adapter is first
+
+        first.healthy = False
+        async with pool.lease("tiktok") as adapter:
+            assert adapter is not first
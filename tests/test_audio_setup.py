@@ -0,0 +1,104 @@
+"""
+Tests for audio setup helpers
+
+Unit tests for streamed installer commands and the shared device cache.
+"""
+
+import pytest
+import asyncio
+import sys
+import threading
+import time
+
+from setup import audio_setup
+from setup.audio_setup import (
+    AudioDevice,
+    _ALREADY_INSTALLED,
+    _STREAM_CHUNK,
+    _start_device_refresh,
+    _stream_command,
+    invalidate_device_cache,
+)
+
+
+def python_child(code):
+    return (sys.executable, "-c", code)
+
+
+@pytest.fixture
+def empty_device_cache():
+    invalidate_device_cache()
+    yield
+    invalidate_device_cache()
+
+
+class TestStreamCommand:
+    """Test suite for _stream_command"""
+
+    @pytest.mark.asyncio
+    async def test_stop_on_match_terminates_child(self):
+        """Test that a matching line ends a command that would otherwise keep running"""
+        started = time.monotonic()
+        returncode, stdout, _, matched = await _stream_command(
+            *python_child("import time; print('blackhole-2ch is already installed', flush=True); time.sleep(30)"),
+            stop_on=_ALREADY_INSTALLED
+        )
+
+        assert matched
+        assert "already installed" in stdout
+        assert returncode != 0
+        assert time.monotonic() - started < 10
+
+    @pytest.mark.asyncio
+    async def test_output_longer_than_a_chunk_without_newline(self):
+        """Test that a progress-bar style line past the read size is neither lost nor fatal"""
+        size = _STREAM_CHUNK * 3
+        returncode, stdout, _, matched = await _stream_command(
+            *python_child(f"import sys; sys.stdout.write('#' * {size} + '\\r100%')")
+        )
+
+        assert returncode == 0
+        assert not matched
+        assert stdout.replace("\n", "") == "#" * size + "100%"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_child(self):
+        """Test that a command past its timeout is stopped and reported"""
+        started = time.monotonic()
+        returncode, _, stderr, matched = await _stream_command(
+            *python_child("import time; time.sleep(30)"), timeout=0.5
+        )
+
+        assert returncode != 0
+        assert not matched
+        assert "timed out" in stderr
+        assert time.monotonic() - started < 10
+
+
+class TestDeviceCache:
+    """Test suite for the module-level device cache"""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_refresh_discards_result(self, monkeypatch, empty_device_cache):
+        """Test that an enumeration started before invalidate_device_cache() is not cached"""
+        release = threading.Event()
+        device = AudioDevice(0, "BlackHole 2ch", 2, 2, 48000.0, "blackhole 2ch")
+
+        def slow_query():
+            release.wait(5)
+            return [device]
+
+        monkeypatch.setattr(audio_setup, "_query_devices", slow_query)
+
+        stale = _start_device_refresh()
+        await asyncio.sleep(0)
+        invalidate_device_cache()
+        release.set()
+
+        assert await stale == [device]
+        assert audio_setup._device_cache is None
+
+        fresh = _start_device_refresh()
+        assert fresh is not stale
+        assert await fresh == [device]
+        assert audio_setup._device_cache[1] == [device]
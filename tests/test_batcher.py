@@ -0,0 +1,87 @@
+"""
+Tests for AsyncBatcher
+
+Unit tests for request coalescing in the hub batcher.
+"""
+
+import pytest
+import asyncio
+
+from hub.batcher import AsyncBatcher
+
+
+class TestAsyncBatcher:
+    """Test suite for AsyncBatcher"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_share_one_call(self):
+        """Test that concurrent submissions are merged and sliced back"""
+        calls = []
+
+        async def handler(items):
+            calls.append(list(items))
+            return [item.upper() for item in items]
+
+        batcher = AsyncBatcher(handler, max_batch=32, max_wait_ms=20)
+        await batcher.start()
+        try:
+            results = await asyncio.gather(
+                batcher.submit(["a", "b"]),
+                batcher.submit(["c"]),
+                batcher.submit(["d", "e", "f"])
+            )
+        finally:
+            await batcher.stop()
+
+        assert results == [["A", "B"], ["C"], ["D", "E", "F"]]
+        assert len(calls) == 1
+        assert calls[0] == ["a", "b", "c", "d", "e", "f"]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_splits_calls(self):
+        """Test that a full batch is dispatched without waiting for more"""
+        calls = []
+
+        async def handler(items):
+            calls.append(len(items))
+            return items
+
+        batcher = AsyncBatcher(handler, max_batch=2, max_wait_ms=20)
+        await batcher.start()
+        try:
+            results = await asyncio.gather(*(batcher.submit([i]) for i in range(4)))
+        finally:
+            await batcher.stop()
+
+        assert results == [[0], [1], [2], [3]]
+        assert calls == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_handler_error_propagates_to_all_submitters(self):
+        """Test that a failed batch fails every waiting submission"""
+        async def handler(items):
+            raise ValueError("backend down")
+
+        batcher = AsyncBatcher(handler, max_wait_ms=20)
+        await batcher.start()
+        try:
+            results = await asyncio.gather(
+                batcher.submit(["a"]),
+                batcher.submit(["b"]),
+                return_exceptions=True
+            )
+        finally:
+            await batcher.stop()
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_submit_requires_running_batcher(self):
+        """Test that submitting before start is rejected"""
+        async def handler(items):
+            return items
+
+        batcher = AsyncBatcher(handler)
+
+        with pytest.raises(RuntimeError):
+            await batcher.submit(["a"])
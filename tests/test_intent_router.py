@@ -0,0 +1,80 @@
+"""
+Tests for IntentRouter
+
+Unit tests for deterministic intent routing in front of the Maya API.
+"""
+
+import pytest
+import asyncio
+
+from hub.intent_router import IntentRouter
+
+
+class FakeWorkingMemory:
+    """In-memory stand-in for the Redis helper's working memory API"""
+
+    def __init__(self, delay: float = 0.0):
+        self.data = {}
+        self.delay = delay
+
+    async def get_working_memory(self, key):
+        await asyncio.sleep(self.delay)
+        return self.data.get(key)
+
+    async def set_working_memory(self, key, data, ttl=None):
+        await asyncio.sleep(self.delay)
+        self.data[key] = data
+        return True
+
+
+MAYA_SOCIAL_POST = {"success": True, "intent_type": "social_post", "suggested_platform": "twitter"}
+
+
+class TestIntentRouter:
+    """Test suite for IntentRouter"""
+
+    def test_classify_by_payload_shape(self):
+        """Test that payload keys outrank intent text"""
+        router = IntentRouter()
+
+        assert router.classify("do something", None, {"texts": ["a", "b"]}) == ("content_analysis", 0.95)
+        assert router.classify("tweet this", None, {"fine_tuning_config": {}})[0] == "fine_tuning"
+        assert router.classify("hello there", None, {}) == (None, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_routes_locally_after_maya_confirms(self):
+        """Test that a confirmed deterministic intent skips Maya next time"""
+        router = IntentRouter(redis_helper=FakeWorkingMemory())
+        content = {"content": "AI is transforming the world!"}
+
+        assert await router.route("Tweet about AI", "twitter", content) is None
+        await router.remember("Tweet about AI", "twitter", content, MAYA_SOCIAL_POST)
+
+        response = await router.route("  tweet   about ai ", "twitter", content)
+        assert response["intent_type"] == "social_post"
+        assert response["routed_locally"] is True
+        assert router.get_stats()["local_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disagreeing_maya_response_is_not_remembered(self):
+        """Test that Maya's answer is only cached when it matches the rules"""
+        router = IntentRouter(redis_helper=FakeWorkingMemory())
+        content = {"content": "Launch week"}
+
+        await router.remember("Share our launch", "twitter", content, {"intent_type": "campaign_management"})
+
+        assert await router.route("Share our launch", "twitter", content) is None
+
+    @pytest.mark.asyncio
+    async def test_slow_redis_opens_breaker_and_fails_open(self):
+        """Test that Redis timeouts degrade to rule-only routing"""
+        router = IntentRouter({"redis_timeout_ms": 1, "breaker_failures": 2}, redis_helper=FakeWorkingMemory(delay=0.05))
+        content = {"content": "AI is transforming the world!"}
+
+        assert await router.route("Tweet about AI", "twitter", content) is None
+        assert await router.route("Tweet about AI", "twitter", content) is None
+
+        response = await router.route("Tweet about AI", "twitter", content)
+        assert response["intent_type"] == "social_post"
+        assert router.get_stats()["redis_breaker_open"] is True
+        assert router.get_stats()["unconfirmed_hits"] == 1
@@ -226,6 +226,21 @@ class TestMayaAPIStub:
         assert result["performance_score"] > 0
         assert len(result["insights"]) > 0
     
+    @pytest.mark.asyncio
+    async def test_call_maya_analyze_intent_batch(self):
+        """Test batched intent analysis returns one result per item, in order"""
+        result = await call_maya("analyze_intent_batch", {
+            "items": [
+                {"intent": "I want to create a tweet about AI innovation", "platform": "twitter"},
+                {"intent": "Create a marketing campaign for our new product"}
+            ]
+        })
+        
+        assert result["success"] is True
+        assert result["count"] == 2
+        assert result["results"][0]["intent_type"] == "social_post"
+        assert result["results"][1]["intent_type"] == "campaign_management"
+    
     @pytest.mark.asyncio
     async def test_call_maya_schedule_content(self):
         """Test direct Maya API call for content scheduling"""
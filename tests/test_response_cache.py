@@ -0,0 +1,97 @@
+"""
+Tests for ResponseCache and SemanticCache
+
+Unit tests for exact and near-match response caching in the hub.
+"""
+
+import pytest
+
+from hub.response_cache import ResponseCache, SemanticCache
+
+
+VECTORS = {
+    "Launch day for our AI assistant": [1.0, 0.0, 0.0],
+    "Launch day for our AI assistant!": [0.99, 0.05, 0.0],
+    "Quarterly revenue report": [0.0, 1.0, 0.0],
+}
+
+
+async def fake_embed(texts):
+    return [VECTORS[text] for text in texts]
+
+
+class TestResponseCache:
+    """Test suite for the exact-match cache"""
+
+    @pytest.mark.asyncio
+    async def test_exact_hit_ignores_key_order(self):
+        """Test that payloads with the same content share a key"""
+        cache = ResponseCache()
+        await cache.set("generate", {"a": 1, "b": 2}, {"success": True}, ttl=60)
+
+        assert await cache.get("generate", {"b": 2, "a": 1}) == {"success": True}
+        assert cache.stats["generate"] == {"hits": 1, "misses": 0}
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Test that the oldest entry is evicted when full"""
+        cache = ResponseCache(max_entries=1)
+        await cache.set("generate", {"n": 1}, {"n": 1}, ttl=60)
+        await cache.set("generate", {"n": 2}, {"n": 2}, ttl=60)
+
+        assert await cache.get("generate", {"n": 1}) is None
+        assert await cache.get("generate", {"n": 2}) == {"n": 2}
+
+
+class TestSemanticCache:
+    """Test suite for near-match lookups"""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_text_hits(self):
+        """Test that a semantically equivalent prompt reuses the stored response"""
+        cache = SemanticCache(ResponseCache(), fake_embed, threshold=0.93)
+        await cache.set("social", {"content": 1}, "Launch day for our AI assistant", {"content": "optimized"}, ttl=60)
+
+        hit = await cache.get("social", {"content": 2}, "Launch day for our AI assistant!")
+        miss = await cache.get("social", {"content": 3}, "Quarterly revenue report")
+
+        assert hit == {"content": "optimized"}
+        assert miss is None
+        assert cache.exact.stats["social"]["semantic_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_near_match_stays_within_scope(self):
+        """Test that the same text for another platform is generated separately"""
+        cache = SemanticCache(ResponseCache(), fake_embed, threshold=0.93)
+        generations = []
+
+        async def optimize(platform, text):
+            payload = {"platform": platform, "content": text}
+            scope = {"platform": platform}
+            cached = await cache.get("social", payload, text, scope)
+            if cached is not None:
+                return cached
+            generations.append(platform)
+            result = {"content": f"{platform}: {text}"}
+            await cache.set("social", payload, text, result, ttl=60, scope=scope)
+            return result
+
+        linkedin = await optimize("linkedin", "Launch day for our AI assistant")
+        twitter = await optimize("twitter", "Launch day for our AI assistant")
+        twitter_again = await optimize("twitter", "Launch day for our AI assistant!")
+
+        assert generations == ["linkedin", "twitter"]
+        assert linkedin == {"content": "linkedin: Launch day for our AI assistant"}
+        assert twitter == twitter_again == {"content": "twitter: Launch day for our AI assistant"}
+
+    @pytest.mark.asyncio
+    async def test_embedding_failure_is_a_miss(self):
+        """Test that the cache fails open when embeddings are unavailable"""
+        async def broken_embed(texts):
+            raise RuntimeError("embeddings down")
+
+        cache = SemanticCache(ResponseCache(), broken_embed)
+        await cache.set("social", {"content": 1}, "anything", {"content": "optimized"}, ttl=60)
+
+        assert await cache.get("social", {"content": 1}, "anything") == {"content": "optimized"}
+        assert await cache.get("social", {"content": 2}, "anything else") is None
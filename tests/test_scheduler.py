@@ -0,0 +1,81 @@
+"""
+Tests for MayaScheduler
+
+Unit tests for the in-process (heap-backed) scheduling path.
+"""
+
+import pytest
+import asyncio
+from datetime import datetime, timedelta
+
+from hub.scheduler import MayaScheduler, ScheduledTask, TaskStatus
+
+
+async def noop_sync_metrics(platform):
+    return None
+
+
+class TestMayaScheduler:
+    """Test suite for MayaScheduler"""
+
+    @pytest.mark.asyncio
+    async def test_task_runs_when_due(self):
+        """Test that the local ticker wakes for a newly scheduled task"""
+        scheduler = MayaScheduler()
+        scheduler._sync_metrics = noop_sync_metrics
+        ticker = asyncio.create_task(scheduler.run_due_tasks())
+        await asyncio.sleep(0)
+
+        task = ScheduledTask(
+            name="sync",
+            function="sync_metrics",
+            args=["twitter"],
+            scheduled_time=datetime.utcnow() + timedelta(milliseconds=100)
+        )
+        await scheduler.schedule_task(task)
+
+        await asyncio.sleep(0.05)
+        assert (await scheduler.get_task(task.id)).status == TaskStatus.PENDING
+
+        await asyncio.sleep(0.15)
+        ticker.cancel()
+        assert (await scheduler.get_task(task.id)).status == TaskStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_started_scheduler_runs_future_task(self):
+        """Test that start() dispatches a future-dated task and stop() ends the ticker"""
+        scheduler = MayaScheduler()
+        scheduler._sync_metrics = noop_sync_metrics
+        await scheduler.start()
+
+        task = ScheduledTask(
+            name="sync",
+            function="sync_metrics",
+            args=["twitter"],
+            scheduled_time=datetime.utcnow() + timedelta(milliseconds=50)
+        )
+        await scheduler.schedule_task(task)
+
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+        assert (await scheduler.get_task(task.id)).status == TaskStatus.COMPLETED
+        assert not scheduler.running
+
+    @pytest.mark.asyncio
+    async def test_failed_task_is_requeued(self):
+        """Test that a failing task goes back on the heap with backoff"""
+        async def broken_sync_metrics(platform):
+            raise RuntimeError("platform down")
+
+        scheduler = MayaScheduler()
+        scheduler._sync_metrics = broken_sync_metrics
+        task = ScheduledTask(name="sync", function="sync_metrics", args=["twitter"])
+
+        await scheduler.schedule_task(task)
+        await asyncio.sleep(0.01)
+
+        stats = await scheduler.get_scheduler_stats()
+        assert task.retry_count == 1
+        assert task.scheduled_time > datetime.utcnow()
+        assert stats["queued_tasks"] == 1
+        assert stats["status_breakdown"]["pending"] == 1